@@ -45,6 +45,14 @@ def main():
     except ImportError:
         pass
     
+    # Run tests in parallel if pytest-xdist is available, one module per worker
+    # so module- and class-scoped fixtures are built once
+    try:
+        import xdist
+        test_args.extend(["-n", "auto", "--dist", "loadfile"])
+    except ImportError:
+        pass
+    
     # Add any command line arguments
     if len(sys.argv) > 1:
         test_args.extend(sys.argv[1:])
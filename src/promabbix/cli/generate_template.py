@@ -7,12 +7,31 @@
 import click
 import os
 import sys
-from typing import Any, Dict, Optional, cast
+from functools import cache, cached_property
+from typing import TYPE_CHECKING, Any, Dict, Optional, cast
 
-from ..core.fs_utils import DataLoader, DataSaver
-from ..core.template import Render
-from ..core.validation import ConfigValidator, ValidationError
-from rich.console import Console
+# Core modules pull in jsonschema, Jinja2 and Rich; they are imported where used
+# so that `promabbix --help` and `promabbix --version` start without them.
+if TYPE_CHECKING:
+    from rich.console import Console
+    from ..core.fs_utils import DataLoader, DataSaver
+    from ..core.validation import ConfigValidator, ValidationError
+
+
+@cache
+def _default_loader() -> "DataLoader":
+    """Shared DataLoader used when no loader is injected."""
+    from ..core.fs_utils import DataLoader
+
+    return DataLoader()
+
+
+@cache
+def _default_saver() -> "DataSaver":
+    """Shared DataSaver used when no saver is injected."""
+    from ..core.fs_utils import DataSaver
+
+    return DataSaver()
 
 
 @click.command(name='generateTemplate')
@@ -42,14 +61,25 @@ def generate_template(config_file: str, output: str, templates: Optional[str],
 class GenerateTemplateCommand:
     """Command handler for generateTemplate functionality."""
 
-    def __init__(self, loader: Optional[DataLoader] = None,
-                 saver: Optional[DataSaver] = None,
-                 validator: Optional[ConfigValidator] = None) -> None:
-        """Initialize command with dependencies."""
-        self.loader = loader or DataLoader()
-        self.saver = saver or DataSaver()
-        self.validator = validator or ConfigValidator()
-        self.console = Console(stderr=True)
+    def __init__(self, loader: Optional["DataLoader"] = None,
+                 saver: Optional["DataSaver"] = None,
+                 validator: Optional["ConfigValidator"] = None) -> None:
+        """Initialize command with dependencies, falling back to shared defaults."""
+        self.loader = loader or _default_loader()
+        self.saver = saver or _default_saver()
+        if validator is None:
+            from ..core.validation import ConfigValidator
+
+            # The built-in schema is compiled once and shared by every ConfigValidator
+            validator = ConfigValidator()
+        self.validator = validator
+
+    @cached_property
+    def console(self) -> "Console":
+        """Console for status messages, created on first use."""
+        from rich.console import Console
+
+        return Console(stderr=True)
 
     def execute(self, config_file: str, output: str, templates: Optional[str],
                 template_name: str, validate_only: bool) -> int:
@@ -66,6 +96,8 @@ class GenerateTemplateCommand:
         Returns:
             Exit code (0 for success, 1 for failure)
         """
+        from ..core.validation import ValidationError
+
         try:
             # Load configuration
             config_data = self.load_configuration(config_file)
@@ -109,6 +141,8 @@ class GenerateTemplateCommand:
     def generate_template_content(self, config_data: Dict[str, Any],
                                   templates: Optional[str], template_name: str) -> str:
         """Generate template content from configuration."""
+        from ..core.template import Render
+
         # Handle default template path
         if templates is None:
             templates = f'{os.path.abspath(os.path.dirname(__file__))}/../templates/'
@@ -131,7 +165,7 @@ class GenerateTemplateCommand:
         """Print validation success message."""
         self.console.print("[green]✓ Configuration validation passed[/green]")
 
-    def print_validation_error(self, error: ValidationError) -> None:
+    def print_validation_error(self, error: "ValidationError") -> None:
         """Print validation error message."""
         self.console.print("[red]✗ Configuration validation failed:[/red]")
         self.console.print(f"[red]{error}[/red]")
@@ -5,19 +5,49 @@
 #
 
 import json
+import re
+from functools import lru_cache
 from typing import Any
 
+# Characters a JSON document may start with, including the NaN/Infinity literals json.loads accepts
+_JSON_START_CHARS = frozenset('{["-0123456789tfnNI')
+_JSON_CLOSING_CHARS = {'{': '}', '[': ']'}
+_JSON_WHITESPACE = ' \t\n\r'
+_JSON_DECODER = json.JSONDecoder()
+# Scalar JSON documents that can be accepted without running the decoder
+_JSON_LITERALS = frozenset({'true', 'false', 'null', 'NaN', 'Infinity', '-Infinity'})
+_JSON_SCALAR_RE = re.compile(
+    r'-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?'
+    r'|"(?:[^"\\\x00-\x1f]|\\["\\/bfnrt]|\\u[0-9a-fA-F]{4})*"'
+)
 
-def isjson(data: Any) -> bool:
-    """ Check if the data is a json
+
+@lru_cache(maxsize=1024)
+def _isjson_str(data: str) -> bool:
+    """ Check if the string is a json document, memoized for repeated template values
     """
+    # Reject obvious non-JSON by its first and last characters before parsing
+    stripped = data.strip(_JSON_WHITESPACE)
+    if not stripped or stripped[0] not in _JSON_START_CHARS:
+        return False
+    closing = _JSON_CLOSING_CHARS.get(stripped[0])
+    if closing is not None and stripped[-1] != closing:
+        return False
+    if stripped in _JSON_LITERALS:
+        return True
+    if closing is None and _JSON_SCALAR_RE.fullmatch(stripped):
+        return True
+    # The string is already stripped, so the document must end exactly where decoding stops
     try:
-        if isinstance(data, str):
-            _ = json.loads(data)
-        elif isinstance(data, (dict, list)):
-            return True
-        else:
-            return False
+        _, end = _JSON_DECODER.raw_decode(stripped)
     except Exception:
         return False
-    return True
+    return end == len(stripped)
+
+
+def isjson(data: Any) -> bool:
+    """ Check if the data is a json
+    """
+    if isinstance(data, str):
+        return _isjson_str(data)
+    return isinstance(data, (dict, list))
@@ -17,6 +17,8 @@ import yaml
 from pathlib import Path
 from typing import Dict, Any, Union, Optional, cast
 
+from .fs_utils import Dumper, Loader
+
 
 def detect_config_format(config_path: Union[str, Path]) -> str:
     """
@@ -37,7 +39,7 @@ def detect_config_format(config_path: Union[str, Path]) -> str:
         # If it's a single file, it's likely unified format
         try:
             with open(path, 'r') as f:
-                config = yaml.safe_load(f)
+                config = yaml.load(f, Loader=Loader)
 
             # Check if it has the unified format structure
             if isinstance(config, dict) and 'groups' in config and 'zabbix' in config:
@@ -119,7 +121,7 @@ def _load_alerts_section(alerts_file: Path) -> Dict[str, Any]:
         raise FileNotFoundError(f"Alerts file {alerts_file} not found")
 
     with open(alerts_file, 'r') as f:
-        alerts_data = yaml.safe_load(f)
+        alerts_data = yaml.load(f, Loader=Loader)
         if not (alerts_data and 'groups' in alerts_data):
             raise ValueError(f"Invalid alerts file format in {alerts_file}")
         return cast(Dict[str, Any], alerts_data['groups'])
@@ -131,7 +133,7 @@ def _load_zabbix_section(zabbix_file: Path) -> Dict[str, Any]:
         raise FileNotFoundError(f"Zabbix configuration file {zabbix_file} not found")
 
     with open(zabbix_file, 'r') as f:
-        zabbix_data = yaml.safe_load(f)
+        zabbix_data = yaml.load(f, Loader=Loader)
         if not (zabbix_data and 'zabbix' in zabbix_data):
             raise ValueError(f"Invalid zabbix file format in {zabbix_file}")
         return cast(Dict[str, Any], zabbix_data['zabbix'])
@@ -144,7 +146,7 @@ def _load_wiki_section(wiki_file: Path) -> Optional[Dict[str, Any]]:
 
     try:
         with open(wiki_file, 'r') as f:
-            wiki_data = yaml.safe_load(f)
+            wiki_data = yaml.load(f, Loader=Loader)
             if wiki_data and 'wiki' in wiki_data:
                 return cast(Dict[str, Any], wiki_data['wiki'])
     except Exception:
@@ -218,4 +220,4 @@ def save_unified_config(config: Dict[str, Any], output_path: Union[str, Path]) -
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
     with open(output_file, 'w') as f:
-        yaml.dump(config, f, default_flow_style=False, sort_keys=False, indent=2)
+        yaml.dump(config, f, Dumper=Dumper, default_flow_style=False, sort_keys=False, indent=2)
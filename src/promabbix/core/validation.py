@@ -6,11 +6,24 @@
 
 import json
 import yaml
+from functools import cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, cast
 from rich.console import Console
-import jsonschema
-from jsonschema import ValidationError as JsonSchemaValidationError
+from jsonschema.exceptions import SchemaError, best_match
+from jsonschema.protocols import Validator
+from jsonschema.validators import validator_for
+
+from .fs_utils import Loader
+
+# Suggestion for each failing JSON Schema keyword, resolved with a single lookup per error
+_SCHEMA_ERROR_SUGGESTIONS: Dict[str, str] = {
+    'required': "Add the missing required field",
+    'additionalProperties': "Remove additional properties or check schema definition",
+    'enum': "Use one of the allowed enum values",
+    'pattern': "Ensure the value matches the required pattern",
+}
+_DEFAULT_SCHEMA_ERROR_SUGGESTION = "Check the field value and type"
 
 
 class ValidationError(Exception):
@@ -51,12 +64,27 @@ class ConfigValidator:
 
         Args:
             schema_path: Path to custom schema file (defaults to built-in schema)
+
+        Without schema_path, ``schema`` is the built-in schema dict shared by
+        every such instance in the process; treat it as read-only. Validation
+        uses the precompiled ``schema_validator``, so editing ``schema`` has
+        no effect on it.
         """
         self.console = Console(stderr=True)
-        self.schema_path = schema_path or self.default_schema_path()
-        self.schema = self.load_schema()
+        if schema_path:
+            self.schema_path = schema_path
+            self.schema = self.load_schema()
+            self.schema_validator = self.compile_schema()
+        else:
+            # The built-in schema never changes at runtime, so reuse it and its compiled
+            # validator; the schema dict is shared across instances and must not be mutated
+            builtin = _builtin_config_validator()
+            self.schema_path = builtin.schema_path
+            self.schema = builtin.schema
+            self.schema_validator = builtin.schema_validator
 
-    def default_schema_path(self) -> str:
+    @staticmethod
+    def default_schema_path() -> str:
         """Get path to default built-in schema."""
         # Get the path to the schemas directory relative to this file
         current_dir = Path(__file__).parent.parent
@@ -67,7 +95,7 @@ class ConfigValidator:
         try:
             with open(self.schema_path, 'r') as f:
                 if self.schema_path.endswith('.yaml') or self.schema_path.endswith('.yml'):
-                    return cast(Dict[str, Any], yaml.safe_load(f))
+                    return cast(Dict[str, Any], yaml.load(f, Loader=Loader))
                 else:
                     return cast(Dict[str, Any], json.load(f))
         except FileNotFoundError:
@@ -82,6 +110,24 @@ class ConfigValidator:
                 suggestions=["Check the schema file for valid YAML/JSON syntax"]
             )
 
+    def compile_schema(self) -> Validator:
+        """
+        Check the loaded schema once and build a reusable validator for it.
+
+        Raises:
+            ValidationError: If the schema itself is not a valid JSON Schema
+        """
+        validator_cls = validator_for(self.schema)
+        try:
+            validator_cls.check_schema(self.schema)
+        except SchemaError as e:
+            raise ValidationError(
+                f"Invalid schema definition: {e.message}",
+                path=self.schema_path,
+                suggestions=["Check the schema file against the JSON Schema specification"]
+            )
+        return cast(Validator, validator_cls(self.schema))
+
     def validate_config(self, config_data: Dict[str, Any]) -> None:
         """
         Validate unified configuration against schema.
@@ -105,32 +151,27 @@ class ConfigValidator:
         Raises:
             ValidationError: If schema validation fails
         """
-        try:
-            jsonschema.validate(config_data, self.schema)
-        except JsonSchemaValidationError as e:
+        e = best_match(self.schema_validator.iter_errors(config_data))
+        if e is not None:
             # Convert jsonschema error to our custom ValidationError
             error_path = ".".join(str(p) for p in e.absolute_path) if e.absolute_path else "root"
 
-            # Extract suggestions based on common error types
-            suggestions = []
-            if "required" in str(e.message).lower():
-                suggestions.append("Add the missing required field")
-            elif "additional properties" in str(e.message).lower():
-                suggestions.append("Remove additional properties or check schema definition")
-            elif "enum" in str(e.message).lower():
-                suggestions.append("Use one of the allowed enum values")
-            elif "pattern" in str(e.message).lower():
-                suggestions.append("Ensure the value matches the required pattern")
-            else:
-                suggestions.append("Check the field value and type")
+            # Pick the suggestion from the schema keyword that failed
+            suggestion = _SCHEMA_ERROR_SUGGESTIONS.get(str(e.validator), _DEFAULT_SCHEMA_ERROR_SUGGESTION)
 
             raise ValidationError(
                 str(e.message),
                 path=error_path,
-                suggestions=suggestions
+                suggestions=[suggestion]
             )
 
 
+@cache
+def _builtin_config_validator() -> ConfigValidator:
+    """Load and compile the built-in schema once per process."""
+    return ConfigValidator(schema_path=ConfigValidator.default_schema_path())
+
+
 class CrossReferenceValidator:
     """Validator for cross-references between configuration sections."""
 
@@ -150,29 +191,34 @@ class CrossReferenceValidator:
         """
         errors: List[ValidationError] = []
 
-        # Only validate if both sections exist
-        if not self.should_validate_wiki_consistency(config):
+        # Most configurations have no wiki section, check it before walking groups
+        wiki = config.get('wiki')
+        groups = config.get('groups')
+        if not wiki or not groups:
+            return errors
+
+        # Only validate if both sections name alerts; each section is walked once
+        wiki_alert_names = ConfigAnalyzer.extract_wiki_alert_names(wiki)
+        if not wiki_alert_names:
             return errors
 
-        # Get alert names from groups
-        groups = config.get('groups', [])
         alert_names = ConfigAnalyzer.extract_alert_names(groups)
+        if not alert_names:
+            return errors
 
-        # Get wiki alert names
-        wiki = config.get('wiki', {})
-        wiki_alert_names = ConfigAnalyzer.extract_wiki_alert_names(wiki)
+        # Fast reject: the subset check allocates nothing when every alert is documented
+        if alert_names <= wiki_alert_names:
+            return errors
 
-        # Find alerts missing from wiki
         missing_docs = alert_names - wiki_alert_names
-        if missing_docs:
-            errors.append(ValidationError(
-                f"Alerts missing wiki documentation: {', '.join(sorted(missing_docs))}",
-                path="wiki.knowledgebase.alerts.alertings",
-                suggestions=[
-                    "Add documentation for each alert in the wiki.knowledgebase.alerts.alertings section",
-                    "Ensure alert names match exactly between groups and wiki sections"
-                ]
-            ))
+        errors.append(ValidationError(
+            f"Alerts missing wiki documentation: {', '.join(sorted(missing_docs))}",
+            path="wiki.knowledgebase.alerts.alertings",
+            suggestions=[
+                "Add documentation for each alert in the wiki.knowledgebase.alerts.alertings section",
+                "Ensure alert names match exactly between groups and wiki sections"
+            ]
+        ))
 
         return errors
 
@@ -186,8 +232,10 @@ class CrossReferenceValidator:
         Returns:
             True if both alerts and wiki knowledgebase exist
         """
-        return (ConfigAnalyzer.has_alerting_rules(config) and
-                ConfigAnalyzer.has_wiki_knowledgebase(config))
+        if not config.get('wiki') or not config.get('groups'):
+            return False
+        return (ConfigAnalyzer.has_wiki_knowledgebase(config) and
+                ConfigAnalyzer.has_alerting_rules(config))
 
 
 class ConfigAnalyzer:
@@ -204,7 +252,7 @@ class ConfigAnalyzer:
         Returns:
             Set of alert names
         """
-        alert_names = set()
+        alert_names: Set[str] = set()
 
         for group in groups:
             if group.get('name') == 'alerting_rules':
@@ -227,7 +275,7 @@ class ConfigAnalyzer:
         Returns:
             Set of alert names in wiki
         """
-        alert_names = set()
+        alert_names: Set[str] = set()
 
         knowledgebase = wiki.get('knowledgebase', {})
         alerts = knowledgebase.get('alerts', {})
@@ -4,28 +4,30 @@
 # Copyright 2025 Wrike Inc.
 #
 
+import io
 import pytest
-import tempfile
 import sys
+import yaml
+from click.testing import CliRunner
 from pathlib import Path
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+# Add src to path for imports, once for the whole test session
+SRC_PATH = str(Path(__file__).resolve().parent.parent / "src")
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
 
+from promabbix.core.fs_utils import Dumper
 
-@pytest.fixture
-def temp_directory():
-    """Create a temporary directory for tests."""
-    with tempfile.TemporaryDirectory() as temp_dir:
-        yield Path(temp_dir)
-
+# Minimal valid unified configuration shared by tests that only read it
+CANONICAL_CONFIG = {
+    "groups": [{"name": "recording_rules", "rules": [{"record": "test", "expr": "1"}]}],
+    "zabbix": {"template": "test"}
+}
 
-@pytest.fixture
-def sample_template_files(temp_directory):
-    """Create sample template files for testing."""
-    templates = {
-        "simple.j2": "Hello {{ name }}!",
-        "complex.j2": """
+# Sample Jinja2 templates, encoded once so fixtures write raw bytes
+SAMPLE_TEMPLATES = {
+    "simple.j2": "Hello {{ name }}!",
+    "complex.j2": """
         {## Complex template ##}
         Project: {{ project.name }}
         Version: {{ project.version }}
@@ -35,16 +37,129 @@ def sample_template_files(temp_directory):
         - {{ feature }}
         {%- endfor %}
         """,
-        "with_filters.j2": "File: {{ filepath | basename }}, Date: {{ date_time('%Y-%m-%d') }}",
-        "with_lookup.j2": "Result: {{ lookup_template(data, 'Value is {{ value }}') }}"
-    }
-    
+    "with_filters.j2": "File: {{ filepath | basename }}, Date: {{ date_time('%Y-%m-%d') }}",
+    "with_lookup.j2": "Result: {{ lookup_template(data, 'Value is {{ value }}') }}"
+}
+SAMPLE_TEMPLATES_BYTES = {name: content.encode() for name, content in SAMPLE_TEMPLATES.items()}
+
+
+@pytest.fixture(scope="session")
+def temp_directory_session(tmp_path_factory):
+    """Create a temporary directory shared by the whole test session."""
+    return tmp_path_factory.mktemp("session")
+
+
+@pytest.fixture(scope="session")
+def canonical_config_file(temp_directory_session):
+    """Write the canonical valid configuration once per session and return its path."""
+    config_file = temp_directory_session / "config.yaml"
+    with config_file.open('wb') as f:
+        yaml.dump(CANONICAL_CONFIG, f, Dumper=Dumper, encoding='utf-8')
+    return config_file
+
+
+@pytest.fixture(scope="session")
+def runner():
+    """Provide a Click test runner shared by the whole session."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def shared_validator():
+    """Provide one ConfigValidator for the built-in schema, shared by the whole session."""
+    from promabbix.core.validation import ConfigValidator
+
+    return ConfigValidator()
+
+
+@pytest.fixture(scope="session")
+def generate_command():
+    """Provide one GenerateTemplateCommand with default dependencies for the whole session."""
+    from promabbix.cli.generate_template import GenerateTemplateCommand
+
+    return GenerateTemplateCommand()
+
+
+def _null_console():
+    """Build a Rich console that writes plain text into memory instead of the terminal."""
+    from rich.console import Console
+
+    return Console(file=io.StringIO(), force_terminal=False, no_color=True, width=80)
+
+
+@pytest.fixture(scope="session")
+def loader():
+    """Provide one DataLoader with a silent console, shared by the whole session."""
+    from promabbix.core.fs_utils import DataLoader
+
+    data_loader = DataLoader()
+    data_loader.console = _null_console()
+    return data_loader
+
+
+@pytest.fixture(scope="session")
+def saver():
+    """Provide one DataSaver with a silent console, shared by the whole session."""
+    from promabbix.core.fs_utils import DataSaver
+
+    data_saver = DataSaver()
+    data_saver.console = _null_console()
+    return data_saver
+
+
+@pytest.fixture
+def printed(monkeypatch, loader, saver):
+    """Record the message of every console.print on the shared loader and saver."""
+    messages = []
+
+    def record(*args, **kwargs):
+        messages.append(args[0] if args else "")
+
+    monkeypatch.setattr(loader.console, "print", record)
+    monkeypatch.setattr(saver.console, "print", record)
+    return messages
+
+
+@pytest.fixture
+def stub_render(monkeypatch):
+    """Replace Jinja template rendering with a canned Zabbix export and record each render call."""
+    from promabbix.core.template import Render
+
+    calls = []
+
+    def render_file(self, **kwargs):
+        calls.append(kwargs)
+        return '{"zabbix_export": {}}'
+
+    monkeypatch.setattr(Render, "render_file", render_file)
+    return calls
+
+
+@pytest.fixture
+def reset_singletons():
+    """Drop the shared GenerateTemplateCommand defaults before and after a test."""
+    from promabbix.cli import generate_template
+
+    factories = (
+        generate_template._default_loader,
+        generate_template._default_saver,
+    )
+    for factory in factories:
+        factory.cache_clear()
+    yield
+    for factory in factories:
+        factory.cache_clear()
+
+
+@pytest.fixture
+def sample_template_files(tmp_path):
+    """Create sample template files for testing."""
     template_files = {}
-    for filename, content in templates.items():
-        template_file = temp_directory / filename
-        template_file.write_text(content)
+    for filename, content in SAMPLE_TEMPLATES_BYTES.items():
+        template_file = tmp_path / filename
+        template_file.write_bytes(content)
         template_files[filename] = template_file
-    
+
     return template_files
 
 
@@ -6,174 +6,174 @@
 
 import pytest
 import yaml
-from pathlib import Path
-import sys
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from promabbix.core.fs_utils import Dumper
+from promabbix.core.validation import CrossReferenceValidator
 
-from promabbix.core.fs_utils import DataLoader
 
-
-class TestConfigurationsWithoutWiki:
-    """Test configurations that don't include wiki sections."""
-
-    @pytest.fixture
-    def sysops_config_no_wiki(self, temp_directory):
-        """Sysops-style configuration without wiki section."""
-        config = {
-            "groups": [
-                {
-                    "name": "recording_rules",
-                    "rules": [
-                        {
-                            "record": "postgres_connections",
-                            "expr": "sum(pg_stat_database_numbackends{project=\"postgres\"})by(project,cluster,instance)"
+@pytest.fixture(scope="module")
+def sysops_config_no_wiki(tmp_path_factory):
+    """Sysops-style configuration without wiki section."""
+    config = {
+        "groups": [
+            {
+                "name": "recording_rules",
+                "rules": [
+                    {
+                        "record": "postgres_connections",
+                        "expr": "sum(pg_stat_database_numbackends{project=\"postgres\"})by(project,cluster,instance)"
+                    },
+                    {
+                        "record": "postgres_max_connections",
+                        "expr": "sum(pg_settings_max_connections{project=\"postgres\"})by(project,cluster,instance)"
+                    }
+                ]
+            },
+            {
+                "name": "alerting_rules",
+                "rules": [
+                    {
+                        "alert": "postgres_connections",
+                        "expr": "postgres_connections >= {$POSTGRES.CONNECTIONS.MAX}",
+                        "annotations": {
+                            "description": "instance: {{$labels.instance}}, connections: {{$value}}",
+                            "summary": "PostgreSQL instance {{$labels.instance}} has high connection count"
                         },
-                        {
-                            "record": "postgres_max_connections",
-                            "expr": "sum(pg_settings_max_connections{project=\"postgres\"})by(project,cluster,instance)"
+                        "labels": {
+                            "__zbx_priority": "WARNING"
                         }
-                    ]
-                },
+                    }
+                ]
+            }
+        ],
+        "prometheus": {
+            "api": {
+                "url": "http://victoria-metrics.monitoring.svc:8481/api/v1/query"
+            }
+        },
+        "zabbix": {
+            "template": "sysops_service_postgres_minimal",
+            "name": "Template Module Prometheus SysOps service postgres minimal",
+            "macros": [
                 {
-                    "name": "alerting_rules",
-                    "rules": [
-                        {
-                            "alert": "postgres_connections",
-                            "expr": "postgres_connections >= {$POSTGRES.CONNECTIONS.MAX}",
-                            "annotations": {
-                                "description": "instance: {{$labels.instance}}, connections: {{$value}}",
-                                "summary": "PostgreSQL instance {{$labels.instance}} has high connection count"
-                            },
-                            "labels": {
-                                "__zbx_priority": "WARNING"
-                            }
-                        }
-                    ]
+                    "macro": "{$POSTGRES.CONNECTIONS.MAX}",
+                    "value": 100,
+                    "description": "Maximum PostgreSQL connections threshold"
                 }
             ],
-            "prometheus": {
-                "api": {
-                    "url": "http://victoria-metrics.monitoring.svc:8481/api/v1/query"
+            "hosts": [
+                {
+                    "host_name": "postgres-prod-minimal",
+                    "visible_name": "Service Postgres Prod Minimal",
+                    "host_groups": ["Prometheus pseudo hosts"],
+                    "link_templates": ["templ_module_promt_sysops_service_postgres_minimal"],
+                    "status": "enabled",
+                    "state": "present",
+                    "proxy": "gce-infra-zbx-pr02"
                 }
-            },
-            "zabbix": {
-                "template": "sysops_service_postgres_minimal",
-                "name": "Template Module Prometheus SysOps service postgres minimal",
-                "macros": [
+            ]
+        }
+        # Intentionally no wiki section
+    }
+    
+    config_file = tmp_path_factory.mktemp("sysops") / "postgres-minimal-config.yaml"
+    config_file.write_bytes(yaml.dump(config, Dumper=Dumper, encoding='utf-8',
+                                      default_flow_style=False, sort_keys=False))
+    return config_file
+
+
+@pytest.fixture(scope="module")
+def wrike_config_no_wiki(tmp_path_factory):
+    """Wrike-style configuration without wiki section."""
+    config = {
+        "groups": [
+            {
+                "name": "recording_rules",
+                "rules": [
                     {
-                        "macro": "{$POSTGRES.CONNECTIONS.MAX}",
-                        "value": 100,
-                        "description": "Maximum PostgreSQL connections threshold"
+                        "record": "app_http_error_rate",
+                        "expr": "sum(rate(http_requests_total{status=~\"5..\",service=\"app-login-server\"}[5m])) / sum(rate(http_requests_total{service=\"app-login-server\"}[5m]))"
                     }
-                ],
-                "hosts": [
+                ]
+            },
+            {
+                "name": "alerting_rules",
+                "rules": [
                     {
-                        "host_name": "postgres-prod-minimal",
-                        "visible_name": "Service Postgres Prod Minimal",
-                        "host_groups": ["Prometheus pseudo hosts"],
-                        "link_templates": ["templ_module_promt_sysops_service_postgres_minimal"],
-                        "status": "enabled",
-                        "state": "present",
-                        "proxy": "gce-infra-zbx-pr02"
+                        "alert": "app_http_error_rate",
+                        "expr": "app_http_error_rate >= {$HTTP.ERROR.RATE.MAX}",
+                        "annotations": {
+                            "description": "service: {{$labels.service}}, error_rate: {{$value}}",
+                            "summary": "High HTTP error rate for {{$labels.service}}"
+                        },
+                        "labels": {
+                            "__zbx_priority": "HIGH"
+                        }
                     }
                 ]
             }
-            # Intentionally no wiki section
-        }
-        
-        config_file = temp_directory / "postgres-minimal-config.yaml"
-        config_file.write_text(yaml.dump(config, default_flow_style=False, sort_keys=False))
-        return config_file
-
-    @pytest.fixture
-    def wrike_config_no_wiki(self, temp_directory):
-        """Wrike-style configuration without wiki section."""
-        config = {
-            "groups": [
+        ],
+        "zabbix": {
+            "template": "wrike_app_login_server_minimal",
+            "name": "Template Module Prometheus Wrike app-login-server minimal",
+            "hosts": [
                 {
-                    "name": "recording_rules",
-                    "rules": [
+                    "host_name": "app-login-server-minimal",
+                    "visible_name": "App Login Server Minimal",
+                    "host_groups": ["Kubernetes clusters", "Backend services"],
+                    "link_templates": ["templ_module_promt_wrike_app_login_server_minimal"],
+                    "status": "enabled",
+                    "state": "present",
+                    "proxy": "gce-infra-zbx-pr02",
+                    "macros": [
                         {
-                            "record": "app_http_error_rate",
-                            "expr": "sum(rate(http_requests_total{status=~\"5..\",service=\"app-login-server\"}[5m])) / sum(rate(http_requests_total{service=\"app-login-server\"}[5m]))"
-                        }
-                    ]
-                },
-                {
-                    "name": "alerting_rules",
-                    "rules": [
-                        {
-                            "alert": "app_http_error_rate",
-                            "expr": "app_http_error_rate >= {$HTTP.ERROR.RATE.MAX}",
-                            "annotations": {
-                                "description": "service: {{$labels.service}}, error_rate: {{$value}}",
-                                "summary": "High HTTP error rate for {{$labels.service}}"
-                            },
-                            "labels": {
-                                "__zbx_priority": "HIGH"
-                            }
+                            "macro": "{$HTTP.ERROR.RATE.MAX}",
+                            "value": 0.05,
+                            "description": "Maximum HTTP error rate (5%)"
                         }
                     ]
                 }
-            ],
-            "zabbix": {
-                "template": "wrike_app_login_server_minimal",
-                "name": "Template Module Prometheus Wrike app-login-server minimal",
-                "hosts": [
+            ]
+        }
+        # Intentionally no wiki section
+    }
+    
+    config_file = tmp_path_factory.mktemp("wrike") / "app-login-server-minimal-config.yaml"
+    config_file.write_bytes(yaml.dump(config, Dumper=Dumper, encoding='utf-8',
+                                      default_flow_style=False, sort_keys=False))
+    return config_file
+
+
+@pytest.fixture(scope="module")
+def really_minimal_config(tmp_path_factory):
+    """Absolutely minimal configuration with only required fields."""
+    config = {
+        "groups": [
+            {
+                "name": "recording_rules",
+                "rules": [
                     {
-                        "host_name": "app-login-server-minimal",
-                        "visible_name": "App Login Server Minimal",
-                        "host_groups": ["Kubernetes clusters", "Backend services"],
-                        "link_templates": ["templ_module_promt_wrike_app_login_server_minimal"],
-                        "status": "enabled",
-                        "state": "present",
-                        "proxy": "gce-infra-zbx-pr02",
-                        "macros": [
-                            {
-                                "macro": "{$HTTP.ERROR.RATE.MAX}",
-                                "value": 0.05,
-                                "description": "Maximum HTTP error rate (5%)"
-                            }
-                        ]
+                        "record": "simple_metric",
+                        "expr": "1"
                     }
                 ]
             }
-            # Intentionally no wiki section
+        ],
+        "zabbix": {
+            "template": "minimal_template"
         }
-        
-        config_file = temp_directory / "app-login-server-minimal-config.yaml"
-        config_file.write_text(yaml.dump(config, default_flow_style=False, sort_keys=False))
-        return config_file
+    }
+    
+    config_file = tmp_path_factory.mktemp("minimal") / "minimal-config.yaml"
+    config_file.write_bytes(yaml.dump(config, Dumper=Dumper, encoding='utf-8', default_flow_style=False))
+    return config_file
 
-    @pytest.fixture
-    def really_minimal_config(self, temp_directory):
-        """Absolutely minimal configuration with only required fields."""
-        config = {
-            "groups": [
-                {
-                    "name": "recording_rules",
-                    "rules": [
-                        {
-                            "record": "simple_metric",
-                            "expr": "1"
-                        }
-                    ]
-                }
-            ],
-            "zabbix": {
-                "template": "minimal_template"
-            }
-        }
-        
-        config_file = temp_directory / "minimal-config.yaml"
-        config_file.write_text(yaml.dump(config, default_flow_style=False))
-        return config_file
 
-    def test_load_sysops_config_without_wiki(self, sysops_config_no_wiki):
+class TestConfigurationsWithoutWiki:
+    """Test configurations that don't include wiki sections."""
+
+    def test_load_sysops_config_without_wiki(self, sysops_config_no_wiki, loader):
         """Test loading sysops configuration without wiki section."""
-        loader = DataLoader()
         config = loader.load_from_file(str(sysops_config_no_wiki))
         
         assert "groups" in config
@@ -187,9 +187,8 @@ class TestConfigurationsWithoutWiki:
         assert config["groups"][1]["name"] == "alerting_rules"
         assert config["zabbix"]["template"] == "sysops_service_postgres_minimal"
 
-    def test_load_wrike_config_without_wiki(self, wrike_config_no_wiki):
+    def test_load_wrike_config_without_wiki(self, wrike_config_no_wiki, loader):
         """Test loading wrike configuration without wiki section."""
-        loader = DataLoader()
         config = loader.load_from_file(str(wrike_config_no_wiki))
         
         assert "groups" in config
@@ -201,9 +200,8 @@ class TestConfigurationsWithoutWiki:
         assert len(config["groups"][1]["rules"]) == 1
         assert config["groups"][1]["rules"][0]["alert"] == "app_http_error_rate"
 
-    def test_load_really_minimal_config(self, really_minimal_config):
+    def test_load_really_minimal_config(self, really_minimal_config, loader):
         """Test loading absolutely minimal configuration."""
-        loader = DataLoader()
         config = loader.load_from_file(str(really_minimal_config))
         
         assert "groups" in config
@@ -217,65 +215,48 @@ class TestConfigurationsWithoutWiki:
         assert config["groups"][0]["name"] == "recording_rules"
         assert config["zabbix"]["template"] == "minimal_template"
 
-    def test_validation_without_wiki_should_pass(self, sysops_config_no_wiki):
+    def test_validation_without_wiki_should_pass(self, sysops_config_no_wiki, shared_validator, loader):
         """Test that validation passes for configurations without wiki section."""
-        loader = DataLoader()
         config = loader.load_from_file(str(sysops_config_no_wiki))
         
         # Should pass validation (wiki is optional)
-        from promabbix.core.validation import ConfigValidator
-        validator = ConfigValidator()
-        validator.validate_config(config)  # Should not raise exception
+        shared_validator.validate_config(config)  # Should not raise exception
 
-    def test_no_cross_reference_validation_without_wiki(self, wrike_config_no_wiki):
+    def test_no_cross_reference_validation_without_wiki(self, wrike_config_no_wiki, shared_validator, loader):
         """Test that cross-reference validation is skipped when wiki section is absent."""
-        loader = DataLoader()
         config = loader.load_from_file(str(wrike_config_no_wiki))
         
-        # Should pass validation (no cross-reference check)
-        from promabbix.core.validation import ConfigValidator
-        validator = ConfigValidator()
-        validator.validate_config(config)  # Should not raise exception
+        # Should pass validation and report no missing wiki documentation
+        shared_validator.validate_config(config)  # Should not raise exception
+        assert CrossReferenceValidator().validate_alert_wiki_consistency(config) == []
 
-    def test_template_generation_without_wiki(self, sysops_config_no_wiki, temp_directory):
+    def test_template_generation_without_wiki(self, sysops_config_no_wiki, tmp_path, stub_render, generate_command):
         """Test that template generation works without wiki section."""
-        from promabbix.cli.generate_template import GenerateTemplateCommand
-        from unittest.mock import patch
+        output_file = tmp_path / "output.json"
         
-        command = GenerateTemplateCommand()
-        output_file = temp_directory / "output.json"
-        
-        # Mock template rendering to avoid needing actual template files
-        with patch('promabbix.core.template.Render.render_file', return_value='{"mock": "template"}'):
-            result = command.execute(
-                config_file=str(sysops_config_no_wiki),
-                output=str(output_file),
-                templates=None,
-                template_name="prometheus_alert_rules_to_zbx_template.j2",
-                validate_only=False
-            )
-            assert result == 0  # Should succeed
+        result = generate_command.execute(
+            config_file=str(sysops_config_no_wiki),
+            output=str(output_file),
+            templates=None,
+            template_name="prometheus_alert_rules_to_zbx_template.j2",
+            validate_only=False
+        )
+        assert result == 0  # Should succeed
 
-    def test_promabbix_app_minimal_config(self, really_minimal_config, temp_directory):
+    def test_promabbix_app_minimal_config(self, really_minimal_config, tmp_path, stub_render, generate_command):
         """Test GenerateTemplateCommand with absolutely minimal configuration."""
-        from promabbix.cli.generate_template import GenerateTemplateCommand
-        from unittest.mock import patch
-        
-        command = GenerateTemplateCommand()
-        output_file = temp_directory / "output.json"
+        output_file = tmp_path / "output.json"
         
-        # Mock template rendering to avoid needing actual template files
-        with patch('promabbix.core.template.Render.render_file', return_value='{"mock": "template"}'):
-            result = command.execute(
-                config_file=str(really_minimal_config),
-                output=str(output_file),
-                templates=None,
-                template_name="prometheus_alert_rules_to_zbx_template.j2",
-                validate_only=False
-            )
-            assert result == 0  # Should handle minimal config correctly
+        result = generate_command.execute(
+            config_file=str(really_minimal_config),
+            output=str(output_file),
+            templates=None,
+            template_name="prometheus_alert_rules_to_zbx_template.j2",
+            validate_only=False
+        )
+        assert result == 0  # Should handle minimal config correctly
 
-    def test_mixed_configs_some_with_some_without_wiki(self, temp_directory):
+    def test_mixed_configs_some_with_some_without_wiki(self, tmp_path, shared_validator, loader):
         """Test handling multiple configurations where some have wiki and some don't."""
         # Config with wiki
         config_with_wiki = {
@@ -304,13 +285,11 @@ class TestConfigurationsWithoutWiki:
             "zabbix": {"template": "without_wiki"}
         }
         
-        config_with_wiki_file = temp_directory / "with-wiki.yaml"
-        config_without_wiki_file = temp_directory / "without-wiki.yaml"
-        
-        config_with_wiki_file.write_text(yaml.dump(config_with_wiki))
-        config_without_wiki_file.write_text(yaml.dump(config_without_wiki))
+        config_with_wiki_file = tmp_path / "with-wiki.yaml"
+        config_without_wiki_file = tmp_path / "without-wiki.yaml"
         
-        loader = DataLoader()
+        config_with_wiki_file.write_bytes(yaml.dump(config_with_wiki, Dumper=Dumper, encoding='utf-8'))
+        config_without_wiki_file.write_bytes(yaml.dump(config_without_wiki, Dumper=Dumper, encoding='utf-8'))
         
         # Both should load successfully
         wiki_config = loader.load_from_file(str(config_with_wiki_file))
@@ -320,7 +299,5 @@ class TestConfigurationsWithoutWiki:
         assert "wiki" not in no_wiki_config
         
         # Both should validate successfully
-        from promabbix.core.validation import ConfigValidator
-        validator = ConfigValidator()
-        validator.validate_config(wiki_config)  # Should validate cross-references
-        validator.validate_config(no_wiki_config)  # Should skip cross-reference validation
\ No newline at end of file
+        shared_validator.validate_config(wiki_config)  # Should validate cross-references
+        shared_validator.validate_config(no_wiki_config)  # Should skip cross-reference validation
\ No newline at end of file
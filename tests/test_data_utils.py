@@ -6,148 +6,199 @@
 
 import pytest
 import json
-from pathlib import Path
 
-# Add src to path for imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from promabbix.core.data_utils import isjson, _isjson_str
 
-from promabbix.core.data_utils import isjson
+
+VALID_JSON_STRINGS = (
+    '{}',
+    '[]',
+    '{"key": "value"}',
+    '{"number": 42}',
+    '{"boolean": true}',
+    '{"null_value": null}',
+    '[1, 2, 3]',
+    '["string", "array"]',
+    '{"nested": {"object": "value"}}',
+    '[{"mixed": "array"}, {"of": "objects"}]',
+    '"simple string"',
+    '42',
+    'true',
+    'false',
+    'null',
+    '0',
+    '-1',
+    '3.14',
+    '1.23e-4',
+)
+
+INVALID_JSON_STRINGS = (
+    '{',  # Unclosed brace
+    '}',  # Unmatched brace
+    '[',  # Unclosed bracket
+    ']',  # Unmatched bracket
+    '{"key": }',  # Missing value
+    '{"key" "value"}',  # Missing colon
+    '{key: "value"}',  # Unquoted key
+    "{'key': 'value'}",  # Single quotes
+    '{"key": "value",}',  # Trailing comma
+    '[1, 2, 3,]',  # Trailing comma in array
+    '{"key": undefined}',  # Undefined value
+    'plain text',  # Plain text
+    '',  # Empty string
+    ' \n\t ',  # Whitespace only
+    '{broken json',  # Malformed
+    'function() {}',  # JavaScript function
+    '<!-- comment -->',  # HTML comment
+)
+
+DICT_OBJECTS = (
+    {},
+    {"key": "value"},
+    {"number": 42},
+    {"boolean": True},
+    {"null_value": None},
+    {"nested": {"object": "value"}},
+    {"mixed": ["array", "values"]},
+    {"complex": {"nested": {"deeply": {"value": 123}}}},
+)
+
+LIST_OBJECTS = (
+    [],
+    [1, 2, 3],
+    ["string", "array"],
+    [{"mixed": "array"}, {"of": "objects"}],
+    [True, False, None],
+    [[1, 2], [3, 4]],  # Nested lists
+    [{"nested": "objects"}, ["and", "arrays"]],
+)
+
+NON_JSON_TYPES = (
+    42,  # Integer
+    3.14,  # Float
+    True,  # Boolean
+    False,  # Boolean
+    None,  # None
+    set([1, 2, 3]),  # Set
+    (1, 2, 3),  # Tuple
+    bytes(b'binary data'),  # Bytes
+    bytearray(b'binary data'),  # Bytearray
+    lambda x: x,  # Function
+    object(),  # Generic object
+    complex(1, 2),  # Complex number
+)
+
+EDGE_CASES = (
+    ('   {}   ', True),  # JSON with whitespace
+    ('\n{\n  "key": "value"\n}\n', True),  # JSON with newlines
+    ('\t[\t1,\t2,\t3\t]\t', True),  # JSON with tabs
+    ('{"unicode": "тест"}', True),  # Unicode content
+    ('{"emoji": "🚀"}', True),  # Emoji content
+    ('{"escaped": "line\\nbreak"}', True),  # Escaped characters
+    ('{"quote": "He said \\"Hello\\""}', True),  # Escaped quotes
+)
+
+MALFORMED_PATTERNS = (
+    '{"key": "value"',  # Missing closing brace
+    '"key": "value"}',  # Missing opening brace
+    '{"key": "value"}}',  # Extra closing brace
+    '{{"key": "value"}',  # Extra opening brace
+    '{"key": "value" "key2": "value2"}',  # Missing comma
+    '{"key": "value",, "key2": "value2"}',  # Double comma
+    '{"key": "value", "key2":}',  # Missing value
+    '{"key": , "key2": "value2"}',  # Missing value after comma
+    '[1, 2, 3',  # Missing closing bracket
+    '1, 2, 3]',  # Missing opening bracket
+    '[1, 2, 3]]',  # Extra closing bracket
+    '[[1, 2, 3]',  # Extra opening bracket
+    '[1,, 2, 3]',  # Double comma in array
+    '[1, 2, 3, ]',  # Trailing comma
+)
+
+SPECIAL_VALUES = (
+    ('null', True),
+    ('true', True),
+    ('false', True),
+    ('0', True),
+    ('-0', True),
+    ('1', True),
+    ('-1', True),
+    ('1.0', True),
+    ('-1.0', True),
+    ('1e10', True),
+    ('1E10', True),
+    ('1e-10', True),
+    ('1E-10', True),
+    ('"string"', True),
+    ('""', True),  # Empty string
+    ('NaN', True),  # Python json.loads accepts NaN
+    ('Infinity', True),  # Python json.loads accepts Infinity
+    ('-Infinity', True),  # Python json.loads accepts -Infinity
+    ('{"key": NaN}', True),  # NaN in object
+    ('{"key": Infinity}', True),  # Infinity in object
+    ('{"key": -Infinity}', True),  # -Infinity in object
+)
+
+SCALAR_BOUNDARY_CASES = (
+    '1١',  # Non-ASCII digit is not a JSON number
+    '01',  # Leading zero
+    '1.',  # Missing fraction digits
+    '-NaN',  # NaN cannot be negated
+    '"tab\there"',  # Raw control character inside string
+    '"\\q"',  # Invalid escape
+    '"\\u12"',  # Short unicode escape
+    '"\\ud800"',  # Lone surrogate escape
+)
+
+# Large structures are built once per module rather than on every test run
+LARGE_DICT = {f"key_{i}": f"value_{i}" for i in range(1000)}
+LARGE_ARRAY = list(range(1000))
+LARGE_JSON_STR = json.dumps(LARGE_DICT)
 
 
 class TestIsJsonFunction:
     """Test isjson function in data_utils module."""
     
-    def test_isjson_valid_json_strings(self):
+    @pytest.mark.parametrize("json_str", VALID_JSON_STRINGS)
+    def test_isjson_valid_json_strings(self, json_str):
         """Test isjson with valid JSON strings."""
-        valid_json_strings = [
-            '{}',
-            '[]',
-            '{"key": "value"}',
-            '{"number": 42}',
-            '{"boolean": true}',
-            '{"null_value": null}',
-            '[1, 2, 3]',
-            '["string", "array"]',
-            '{"nested": {"object": "value"}}',
-            '[{"mixed": "array"}, {"of": "objects"}]',
-            '"simple string"',
-            '42',
-            'true',
-            'false',
-            'null',
-            '0',
-            '-1',
-            '3.14',
-            '1.23e-4',
-        ]
-        
-        for json_str in valid_json_strings:
-            assert isjson(json_str) is True, f"Failed for valid JSON: {json_str}"
+        assert isjson(json_str) is True, f"Failed for valid JSON: {json_str}"
     
-    def test_isjson_invalid_json_strings(self):
+    @pytest.mark.parametrize("json_str", INVALID_JSON_STRINGS)
+    def test_isjson_invalid_json_strings(self, json_str):
         """Test isjson with invalid JSON strings."""
-        invalid_json_strings = [
-            '{',  # Unclosed brace
-            '}',  # Unmatched brace
-            '[',  # Unclosed bracket
-            ']',  # Unmatched bracket
-            '{"key": }',  # Missing value
-            '{"key" "value"}',  # Missing colon
-            '{key: "value"}',  # Unquoted key
-            "{'key': 'value'}",  # Single quotes
-            '{"key": "value",}',  # Trailing comma
-            '[1, 2, 3,]',  # Trailing comma in array
-            '{"key": undefined}',  # Undefined value
-            'plain text',  # Plain text
-            '',  # Empty string
-            '{broken json',  # Malformed
-            'function() {}',  # JavaScript function
-            '<!-- comment -->',  # HTML comment
-        ]
-        
-        for json_str in invalid_json_strings:
-            assert isjson(json_str) is False, f"Failed for invalid JSON: {json_str}"
+        assert isjson(json_str) is False, f"Failed for invalid JSON: {json_str}"
     
-    def test_isjson_dict_objects(self):
+    @pytest.mark.parametrize("dict_obj", DICT_OBJECTS)
+    def test_isjson_dict_objects(self, dict_obj):
         """Test isjson with dictionary objects."""
-        dict_objects = [
-            {},
-            {"key": "value"},
-            {"number": 42},
-            {"boolean": True},
-            {"null_value": None},
-            {"nested": {"object": "value"}},
-            {"mixed": ["array", "values"]},
-            {"complex": {"nested": {"deeply": {"value": 123}}}},
-        ]
-        
-        for dict_obj in dict_objects:
-            assert isjson(dict_obj) is True, f"Failed for dict object: {dict_obj}"
+        assert isjson(dict_obj) is True, f"Failed for dict object: {dict_obj}"
     
-    def test_isjson_list_objects(self):
+    @pytest.mark.parametrize("list_obj", LIST_OBJECTS)
+    def test_isjson_list_objects(self, list_obj):
         """Test isjson with list objects."""
-        list_objects = [
-            [],
-            [1, 2, 3],
-            ["string", "array"],
-            [{"mixed": "array"}, {"of": "objects"}],
-            [True, False, None],
-            [[1, 2], [3, 4]],  # Nested lists
-            [{"nested": "objects"}, ["and", "arrays"]],
-        ]
-        
-        for list_obj in list_objects:
-            assert isjson(list_obj) is True, f"Failed for list object: {list_obj}"
+        assert isjson(list_obj) is True, f"Failed for list object: {list_obj}"
     
-    def test_isjson_non_json_types(self):
+    @pytest.mark.parametrize("obj", NON_JSON_TYPES)
+    def test_isjson_non_json_types(self, obj):
         """Test isjson with non-JSON compatible types."""
-        non_json_types = [
-            42,  # Integer
-            3.14,  # Float
-            True,  # Boolean
-            False,  # Boolean
-            None,  # None
-            set([1, 2, 3]),  # Set
-            (1, 2, 3),  # Tuple
-            bytes(b'binary data'),  # Bytes
-            bytearray(b'binary data'),  # Bytearray
-            lambda x: x,  # Function
-            object(),  # Generic object
-            complex(1, 2),  # Complex number
-        ]
-        
-        for obj in non_json_types:
-            assert isjson(obj) is False, f"Failed for non-JSON type: {type(obj).__name__} - {obj}"
+        assert isjson(obj) is False, f"Failed for non-JSON type: {type(obj).__name__} - {obj}"
     
-    def test_isjson_edge_cases(self):
+    @pytest.mark.parametrize("test_input,expected", EDGE_CASES)
+    def test_isjson_edge_cases(self, test_input, expected):
         """Test isjson with edge cases."""
-        edge_cases = [
-            ('   {}   ', True),  # JSON with whitespace
-            ('\n{\n  "key": "value"\n}\n', True),  # JSON with newlines
-            ('\t[\t1,\t2,\t3\t]\t', True),  # JSON with tabs
-            ('{"unicode": "тест"}', True),  # Unicode content
-            ('{"emoji": "🚀"}', True),  # Emoji content
-            ('{"escaped": "line\\nbreak"}', True),  # Escaped characters
-            ('{"quote": "He said \\"Hello\\""}', True),  # Escaped quotes
-        ]
-        
-        for test_input, expected in edge_cases:
-            assert isjson(test_input) is expected, f"Failed for edge case: {test_input}"
+        assert isjson(test_input) is expected, f"Failed for edge case: {test_input}"
     
     def test_isjson_large_json(self):
         """Test isjson with large JSON structures."""
         # Large dictionary
-        large_dict = {f"key_{i}": f"value_{i}" for i in range(1000)}
-        assert isjson(large_dict) is True
+        assert isjson(LARGE_DICT) is True
         
         # Large array
-        large_array = list(range(1000))
-        assert isjson(large_array) is True
+        assert isjson(LARGE_ARRAY) is True
         
         # Large JSON string
-        large_json_str = json.dumps(large_dict)
-        assert isjson(large_json_str) is True
+        assert isjson(LARGE_JSON_STR) is True
     
     def test_isjson_nested_structures(self):
         """Test isjson with deeply nested structures."""
@@ -166,69 +217,37 @@ class TestIsJsonFunction:
         }
         assert isjson(mixed_nested) is True
     
-    def test_isjson_json_serializable_vs_json_string(self):
+    @pytest.mark.parametrize("obj", ({"key": "value"}, [1, 2, 3], {}, []))
+    def test_isjson_json_serializable_vs_json_string(self, obj):
         """Test distinction between JSON-serializable objects and JSON strings."""
         # JSON-serializable objects should return True
-        json_objects = [
-            {"key": "value"},
-            [1, 2, 3],
-            {},
-            []
-        ]
-        
-        for obj in json_objects:
-            assert isjson(obj) is True
-            # Their string representations should also be valid JSON
-            json_str = json.dumps(obj)
-            assert isjson(json_str) is True
+        assert isjson(obj) is True
+        # Their string representations should also be valid JSON
+        assert isjson(json.dumps(obj)) is True
     
-    def test_isjson_malformed_json_variations(self):
+    @pytest.mark.parametrize("malformed", MALFORMED_PATTERNS)
+    def test_isjson_malformed_json_variations(self, malformed):
         """Test various malformed JSON patterns."""
-        malformed_patterns = [
-            '{"key": "value"',  # Missing closing brace
-            '"key": "value"}',  # Missing opening brace
-            '{"key": "value"}}',  # Extra closing brace
-            '{{"key": "value"}',  # Extra opening brace
-            '{"key": "value" "key2": "value2"}',  # Missing comma
-            '{"key": "value",, "key2": "value2"}',  # Double comma
-            '{"key": "value", "key2":}',  # Missing value
-            '{"key": , "key2": "value2"}',  # Missing value after comma
-            '[1, 2, 3',  # Missing closing bracket
-            '1, 2, 3]',  # Missing opening bracket
-            '[1, 2, 3]]',  # Extra closing bracket
-            '[[1, 2, 3]',  # Extra opening bracket
-            '[1,, 2, 3]',  # Double comma in array
-            '[1, 2, 3, ]',  # Trailing comma
-        ]
-        
-        for malformed in malformed_patterns:
-            assert isjson(malformed) is False, f"Should be invalid JSON: {malformed}"
+        assert isjson(malformed) is False, f"Should be invalid JSON: {malformed}"
     
-    def test_isjson_special_json_values(self):
+    @pytest.mark.parametrize("value,expected", SPECIAL_VALUES)
+    def test_isjson_special_json_values(self, value, expected):
         """Test isjson with special JSON values."""
-        special_values = [
-            ('null', True),
-            ('true', True),
-            ('false', True),
-            ('0', True),
-            ('-0', True),
-            ('1', True),
-            ('-1', True),
-            ('1.0', True),
-            ('-1.0', True),
-            ('1e10', True),
-            ('1E10', True),
-            ('1e-10', True),
-            ('1E-10', True),
-            ('"string"', True),
-            ('""', True),  # Empty string
-            ('NaN', True),  # Python json.loads accepts NaN
-            ('Infinity', True),  # Python json.loads accepts Infinity
-            ('-Infinity', True),  # Python json.loads accepts -Infinity
-            ('{"key": NaN}', True),  # NaN in object
-            ('{"key": Infinity}', True),  # Infinity in object
-            ('{"key": -Infinity}', True),  # -Infinity in object
-        ]
-        
-        for value, expected in special_values:
-            assert isjson(value) is expected, f"Failed for special JSON value: {value}"
\ No newline at end of file
+        assert isjson(value) is expected, f"Failed for special JSON value: {value}"
+    
+    def test_isjson_repeated_strings_are_cached(self):
+        """Test repeated string checks are answered from the cache."""
+        _isjson_str.cache_clear()
+        assert isjson('{"cached": true}') is True
+        assert isjson('{"cached": true}') is True
+        assert _isjson_str.cache_info().hits == 1
+
+    @pytest.mark.parametrize("value", SCALAR_BOUNDARY_CASES)
+    def test_isjson_scalar_fast_path_matches_decoder(self, value):
+        """Test scalar strings accepted without decoding agree with json.loads."""
+        try:
+            json.loads(value)
+            expected = True
+        except ValueError:
+            expected = False
+        assert isjson(value) is expected, f"Mismatch with json.loads for: {value!r}"
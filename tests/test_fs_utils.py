@@ -8,18 +8,47 @@
 Unit tests for fs_utils module.
 """
 
+import io
 import pytest
-import tempfile
 import json
-import yaml
 import sys
+import yaml
+from functools import partial
 from pathlib import Path
-from unittest.mock import patch, MagicMock, mock_open
+from unittest.mock import patch
+
+from promabbix.core.fs_utils import DataLoader, DataSaver, Loader
+
+# Payloads shared by the loader and round-trip tests; none of the tests mutate them
+SAMPLE_YAML = """
+name: test
+items:
+  - item1
+  - item2
+config:
+  debug: true
+"""
+SAMPLE_DATA = {
+    "name": "test",
+    "items": ["item1", "item2"],
+    "config": {"debug": True}
+}
+ROUND_TRIP_DATA = {
+    "name": "test",
+    "items": [1, 2, 3],
+    "config": {"debug": True, "timeout": 30},
+    "unicode": "тест"
+}
+CROSS_FORMAT_DATA = {"name": "test", "value": 123}
+SAMPLE_YAML_BYTES = SAMPLE_YAML.encode()
+SAMPLE_JSON_BYTES = json.dumps(SAMPLE_DATA).encode()
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
-from promabbix.core.fs_utils import DataLoader, DataSaver
+def _raising(exc):
+    """Return a stand-in callable that raises exc whatever it is called with."""
+    def _raise(*args, **kwargs):
+        raise exc
+    return _raise
 
 
 class TestDataLoader:
@@ -32,169 +61,156 @@ class TestDataLoader:
         assert loader.console.file is not None
         assert loader.console.file.buffer is not None
         
-    def test_load_from_file_yaml_valid(self):
+    def test_load_from_file_yaml_valid(self, tmp_path, loader):
         """Test loading valid YAML file."""
-        yaml_content = """
-        name: test
-        items:
-          - item1
-          - item2
-        config:
-          debug: true
-        """
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-            
-            loader = DataLoader()
-            result = loader.load_from_file(f.name)
+        file_path = tmp_path / "data.yaml"
+        file_path.write_bytes(SAMPLE_YAML_BYTES)
             
-            assert result['name'] == 'test'
-            assert result['items'] == ['item1', 'item2']
-            assert result['config']['debug'] is True
+        result = loader.load_from_file(str(file_path))
             
-        Path(f.name).unlink()  # cleanup
-        
-    def test_load_from_file_json_valid(self):
+        assert result['name'] == 'test'
+        assert result['items'] == ['item1', 'item2']
+        assert result['config']['debug'] is True
+
+    def test_load_from_file_json_valid(self, tmp_path, loader):
         """Test loading valid JSON file."""
-        json_content = {
-            "name": "test",
-            "items": ["item1", "item2"],
-            "config": {"debug": True}
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            json.dump(json_content, f)
-            f.flush()
+        file_path = tmp_path / "data.json"
+        file_path.write_bytes(SAMPLE_JSON_BYTES)
             
-            loader = DataLoader()
-            result = loader.load_from_file(f.name)
+        result = loader.load_from_file(str(file_path))
             
-            assert result['name'] == 'test'
-            assert result['items'] == ['item1', 'item2']
-            assert result['config']['debug'] is True
-            
-        Path(f.name).unlink()  # cleanup
-        
-    def test_load_from_file_yaml_fallback_to_json(self):
-        """Test loading file that fails as YAML but succeeds as JSON."""
-        # JSON that's not valid YAML (due to true/false vs True/False)
-        json_content = '{"name": "test", "debug": true}'
+        assert result['name'] == 'test'
+        assert result['items'] == ['item1', 'item2']
+        assert result['config']['debug'] is True
+
+    def test_load_from_file_json_object_unknown_extension(self, tmp_path, loader):
+        """Test a JSON object in a file without a JSON extension is parsed as JSON first."""
+        json_content = b'{"name": "test", "debug": true}'
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(json_content)
-            f.flush()
+        file_path = tmp_path / "data.txt"
+        file_path.write_bytes(json_content)
             
-            loader = DataLoader()
-            result = loader.load_from_file(f.name)
+        result = loader.load_from_file(str(file_path))
             
-            assert result['name'] == 'test'
-            assert result['debug'] is True
-            
-        Path(f.name).unlink()  # cleanup
-        
-    def test_load_from_file_with_tilde_path(self):
+        assert result['name'] == 'test'
+        assert result['debug'] is True
+
+    def test_load_from_file_with_tilde_path(self, tmp_path, loader):
         """Test loading file with tilde in path."""
-        yaml_content = "name: test"
+        yaml_content = b"name: test"
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(yaml_content)
-            f.flush()
-            
-            # Create a path with tilde that resolves to the temp file
-            temp_path = Path(f.name)
-            relative_path = temp_path.name
-            
-            loader = DataLoader()
-            # Test with the actual temp file path (can't easily mock tilde expansion)
-            result = loader.load_from_file(f.name)
+        file_path = tmp_path / "data.yaml"
+        file_path.write_bytes(yaml_content)
             
-            assert result['name'] == 'test'
+        # Test with the actual temp file path (can't easily mock tilde expansion)
+        result = loader.load_from_file(str(file_path))
             
-        Path(f.name).unlink()  # cleanup
-        
-    def test_load_from_file_not_found(self):
+        assert result['name'] == 'test'
+
+    def test_load_from_file_not_found(self, loader, printed):
         """Test loading non-existent file."""
-        loader = DataLoader()
+        with pytest.raises(FileNotFoundError):
+            loader.load_from_file('/nonexistent/file.yaml')
         
-        with patch.object(loader.console, 'print') as mock_print:
-            with pytest.raises(FileNotFoundError):
-                loader.load_from_file('/nonexistent/file.yaml')
-            
-            mock_print.assert_called_once()
-            call_args = mock_print.call_args[0][0]
-            assert "Error reading file:" in call_args
-            
-    def test_load_from_file_permission_error(self):
+        assert len(printed) == 1
+        call_args = printed[0]
+        assert "Error reading file:" in call_args
+        
+    def test_load_from_file_permission_error(self, loader, monkeypatch, printed):
         """Test loading file with permission error."""
-        loader = DataLoader()
+        monkeypatch.setattr(Path, 'read_text', _raising(PermissionError("Permission denied")))
+        with pytest.raises(PermissionError):
+            loader.load_from_file('/some/file.yaml')
         
-        with patch('pathlib.Path.read_text', side_effect=PermissionError("Permission denied")):
-            with patch.object(loader.console, 'print') as mock_print:
-                with pytest.raises(PermissionError):
-                    loader.load_from_file('/some/file.yaml')
-                
-                mock_print.assert_called_once()
-                call_args = mock_print.call_args[0][0]
-                assert "Error reading file:" in call_args
-                assert "Permission denied" in call_args
-                
-    def test_load_from_file_invalid_yaml_and_json(self):
+        assert len(printed) == 1
+        call_args = printed[0]
+        assert "Error reading file:" in call_args
+        assert "Permission denied" in call_args
+        
+    def test_load_from_file_invalid_yaml_and_json(self, tmp_path, loader, printed):
         """Test loading file that's neither valid YAML nor JSON."""
-        invalid_content = "{ invalid content that's neither yaml nor json }"
+        invalid_content = b"{ invalid content that's neither yaml nor json }"
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(invalid_content)
-            f.flush()
+        file_path = tmp_path / "data.txt"
+        file_path.write_bytes(invalid_content)
             
-            loader = DataLoader()
-            with patch.object(loader.console, 'print') as mock_print:
-                loader.load_from_file(f.name)
+        result = loader.load_from_file(str(file_path))
 
-                loader = DataLoader()
-                result = loader.load_from_file(f.name)
+        # yes, even this can be loaded
+        assert result['invalid content that\'s neither yaml nor json'] is None
+        assert printed == []
 
-                # yes, even this can be loaded
-                assert result['invalid content that\'s neither yaml nor json'] == None
-
-        Path(f.name).unlink()  # cleanup
-        
-    def test_load_from_file_yaml_error_fallback_json(self):
-        """Test YAML parsing error with successful JSON fallback."""
-        # Content that causes YAML error but is valid JSON
-        content = '{"key": "value with: colon"}'
+    def test_load_from_file_json_object_with_colon_in_value(self, tmp_path, loader):
+        """Test a JSON object whose string value contains a colon is parsed as JSON first."""
+        content = b'{"key": "value with: colon"}'
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            f.write(content)
-            f.flush()
+        file_path = tmp_path / "data.txt"
+        file_path.write_bytes(content)
             
-            loader = DataLoader()
-            result = loader.load_from_file(f.name)
+        result = loader.load_from_file(str(file_path))
             
-            assert result['key'] == 'value with: colon'
-            
-        Path(f.name).unlink()  # cleanup
-        
-    def test_load_from_file_yaml_returns_none(self):
+        assert result['key'] == 'value with: colon'
+
+    def test_load_from_file_yaml_error_fallback_json(self, tmp_path, loader, printed):
+        """Test a document not opening like JSON falls back to JSON when YAML fails."""
+        # PyYAML rejects the escaped surrogate pair, the json module decodes it
+        file_path = tmp_path / "data.txt"
+        file_path.write_bytes(b'"\\ud83d\\ude80"')
+
+        assert loader.load_from_file(str(file_path)) == "\U0001F680"
+        assert printed == []
+
+    def test_load_from_file_json_error_fallback_yaml(self, tmp_path, loader, printed):
+        """Test a document opening with a brace falls back to YAML when JSON fails."""
+        file_path = tmp_path / "data.txt"
+        file_path.write_bytes(b"{a: 1}")
+
+        assert loader.load_from_file(str(file_path)) == {"a": 1}
+        assert printed == []
+
+    def test_load_from_file_json_document_parsed_as_json(self, tmp_path, loader):
+        """Test documents opening with a brace are parsed with JSON semantics first."""
+        file_path = tmp_path / "data.txt"
+        file_path.write_bytes(b'  {"value": 1e5}')
+
+        # YAML 1.1 would resolve 1e5 as a string
+        assert loader.load_from_file(str(file_path)) == {"value": 100000.0}
+
+    def test_load_from_stdin_json_array(self, loader, monkeypatch):
+        """Test loading a JSON array from STDIN."""
+        monkeypatch.setattr(sys, 'stdin', io.StringIO('[1e5, "a: b"]'))
+
+        assert loader.load_from_stdin() == [100000.0, "a: b"]
+
+    def test_load_from_stdin_yaml(self, loader, monkeypatch):
+        """Test loading YAML from STDIN."""
+        monkeypatch.setattr(sys, 'stdin', io.StringIO(SAMPLE_YAML))
+
+        assert loader.load_from_stdin() == SAMPLE_DATA
+
+    def test_load_from_file_yaml_returns_none(self, tmp_path, loader, printed):
         """Test YAML parsing that returns None."""
         # Empty YAML file
-        content = ""
+        content = b""
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            f.write(content)
-            f.flush()
+        file_path = tmp_path / "data.yaml"
+        file_path.write_bytes(content)
             
-            loader = DataLoader()
+        with pytest.raises(ValueError):
+            loader.load_from_file(str(file_path))
             
-            with patch.object(loader.console, 'print') as mock_print:
-                with pytest.raises(ValueError):
-                    loader.load_from_file(f.name)
-                
-                # Should try JSON parsing after YAML returns None
-                mock_print.assert_called_once()
-                
-        Path(f.name).unlink()  # cleanup
+        # Should try JSON parsing after YAML returns None
+        assert len(printed) == 1
+
+    def test_load_from_file_rejects_python_object_tags(self, tmp_path, loader):
+        """Test YAML loading uses the safe loader and refuses python object tags."""
+        content = b"!!python/object/apply:os.getcwd []"
+
+        file_path = tmp_path / "data.yaml"
+        file_path.write_bytes(content)
+
+        with pytest.raises(ValueError):
+            loader.load_from_file(str(file_path))
 
 
 class TestDataSaver:
@@ -207,491 +223,317 @@ class TestDataSaver:
         assert saver.console.file is not None
         assert saver.console.file.buffer is not None
         
-    def test_save_to_file_json_dict(self):
+    def test_save_to_file_json_dict(self, tmp_path, saver, printed):
         """Test save_to_file for dictionary to JSON file."""
         data = {"name": "test", "items": [1, 2, 3]}
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            saver = DataSaver()
+        file_path = tmp_path / "data.json"
             
-            with patch.object(saver.console, 'print') as mock_print:
-                saver.save_to_file(data, f.name)
-                
-                # Verify success message
-                mock_print.assert_called_once()
-                call_args = mock_print.call_args[0][0]
-                assert "Data saved to" in call_args
-                
-            # Verify file content
-            saved_data = json.loads(Path(f.name).read_text())
-            assert saved_data == data
+        saver.save_to_file(data, str(file_path))
             
-        Path(f.name).unlink()  # cleanup
-        
-    def test_save_to_file_valid_json_string(self):
+        # Verify success message
+        assert len(printed) == 1
+        call_args = printed[0]
+        assert "Data saved to" in call_args
+            
+        # Verify file content
+        saved_data = json.loads(file_path.read_bytes())
+        assert saved_data == data
+
+    def test_save_to_file_valid_json_string(self, tmp_path, saver, printed):
         """Test save_to_file for valid JSON string to file."""
         data = '{"name": "test", "value": 123}'
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            saver = DataSaver()
+        file_path = tmp_path / "data.json"
             
-            with patch.object(saver.console, 'print') as mock_print:
-                saver.save_to_file(data, f.name)
-                
-                mock_print.assert_called_once()
-                call_args = mock_print.call_args[0][0]
-                assert "Data saved to" in call_args
-                
-            # Verify file content is properly formatted
-            saved_content = Path(f.name).read_text()
-            saved_data = json.loads(saved_content)
-            assert saved_data == {"name": "test", "value": 123}
+        saver.save_to_file(data, str(file_path))
             
-        Path(f.name).unlink()  # cleanup
-        
-    def test_save_to_file_json_invalid_json_string(self):
+        assert len(printed) == 1
+        call_args = printed[0]
+        assert "Data saved to" in call_args
+            
+        # Verify file content is properly formatted
+        saved_data = json.loads(file_path.read_bytes())
+        assert saved_data == {"name": "test", "value": 123}
+
+    def test_save_to_file_json_invalid_json_string(self, tmp_path, saver, printed):
         """Test save_to_file for invalid JSON string as plain text."""
         data = "not valid json string"
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            saver = DataSaver()
+        file_path = tmp_path / "data.json"
             
-            with patch.object(saver.console, 'print') as mock_print:
-                saver.save_to_file(data, f.name)
-                
-                # Should have two calls: warning and success
-                assert mock_print.call_count == 2
-                warning_call = mock_print.call_args_list[0][0][0]
-                success_call = mock_print.call_args_list[1][0][0]
-                assert "Warning: String is not valid data format" in warning_call
-                assert "Data saved to" in success_call
-                
-            # Verify file content is the original string
-            saved_content = Path(f.name).read_text()
-            assert saved_content == data
+        saver.save_to_file(data, str(file_path))
             
-        Path(f.name).unlink()  # cleanup
-        
-    def test_save_to_file_json_with_tilde_path(self):
+        # Should have two calls: warning and success
+        assert len(printed) == 2
+        warning_call = printed[0]
+        success_call = printed[1]
+        assert "Warning: String is not valid data format" in warning_call
+        assert "Data saved to" in success_call
+            
+        # Verify file content is the original string
+        assert file_path.read_bytes() == data.encode()
+
+    def test_save_to_file_json_with_tilde_path(self, tmp_path, saver, printed):
         """Test save_to_file for JSON file with tilde in path."""
         data = {"test": "value"}
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            saver = DataSaver()
+        file_path = tmp_path / "data.json"
             
-            with patch.object(saver.console, 'print') as mock_print:
-                saver.save_to_file(data, f.name)
-                
-                mock_print.assert_called_once()
-                
-            # Verify file was created and contains correct data
-            saved_data = json.loads(Path(f.name).read_text())
-            assert saved_data == data
+        saver.save_to_file(data, str(file_path))
             
-        Path(f.name).unlink()  # cleanup
-        
-    def test_save_to_file_json_error(self):
+        assert len(printed) == 1
+            
+        # Verify file was created and contains correct data
+        saved_data = json.loads(file_path.read_bytes())
+        assert saved_data == data
+
+    def test_save_to_file_json_error(self, saver, monkeypatch, printed):
         """Test JSON save error handling."""
         data = {"test": "value"}
         
-        saver = DataSaver()
+        monkeypatch.setattr(Path, 'write_text', _raising(PermissionError("Permission denied")))
+        saver.save_to_file(data, '/invalid/path/file.json')
         
-        with patch('pathlib.Path.write_text', side_effect=PermissionError("Permission denied")):
-            with patch.object(saver.console, 'print') as mock_print:
-                saver.save_to_file(data, '/invalid/path/file.json')
-                
-                mock_print.assert_called_once()
-                call_args = mock_print.call_args[0][0]
-                assert "Error saving file:" in call_args
-                assert "Permission denied" in call_args
-                
-    def test_save_to_file_yaml_dict(self):
+        assert len(printed) == 1
+        call_args = printed[0]
+        assert "Error saving file:" in call_args
+        assert "Permission denied" in call_args
+        
+    def test_save_to_file_yaml_dict(self, tmp_path, saver, printed):
         """Test save_to_file for dictionary as YAML file."""
         data = {"name": "test", "items": [1, 2, 3], "config": {"debug": True}}
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            saver = DataSaver()
+        file_path = tmp_path / "data.yaml"
             
-            with patch.object(saver.console, 'print') as mock_print:
-                saver.save_to_file(data, f.name)
-                
-                mock_print.assert_called_once()
-                call_args = mock_print.call_args[0][0]
-                assert "Data saved to" in call_args
-                
-            # Verify file content
-            saved_data = yaml.safe_load(Path(f.name).read_text())
-            assert saved_data == data
+        saver.save_to_file(data, str(file_path))
             
-        Path(f.name).unlink()  # cleanup
-        
-    def test_save_to_file_yaml_valid_yaml_string(self):
+        assert len(printed) == 1
+        call_args = printed[0]
+        assert "Data saved to" in call_args
+            
+        # Verify file content
+        saved_data = yaml.load(file_path.read_bytes(), Loader=Loader)
+        assert saved_data == data
+
+    def test_save_to_file_yaml_valid_yaml_string(self, tmp_path, saver, printed):
         """Test save_to_file for valid YAML string to file."""
         data = "name: test\nvalue: 123"
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            saver = DataSaver()
+        file_path = tmp_path / "data.yaml"
             
-            with patch.object(saver.console, 'print') as mock_print:
-                saver.save_to_file(data, f.name)
-                
-                mock_print.assert_called_once()
-                
-            # Verify file content is properly formatted YAML
-            saved_data = yaml.safe_load(Path(f.name).read_text())
-            assert saved_data == {"name": "test", "value": 123}
+        saver.save_to_file(data, str(file_path))
             
-        Path(f.name).unlink()  # cleanup
-        
-    def test_save_to_file_yaml_empty_string(self):
+        assert len(printed) == 1
+            
+        # Verify file content is properly formatted YAML
+        saved_data = yaml.load(file_path.read_bytes(), Loader=Loader)
+        assert saved_data == {"name": "test", "value": 123}
+
+    def test_save_to_file_yaml_empty_string(self, tmp_path, saver, printed):
         """Test save_to_file for empty string as YAML."""
         data = ""
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            saver = DataSaver()
+        file_path = tmp_path / "data.yaml"
             
-            with patch.object(saver.console, 'print') as mock_print:
-                saver.save_to_file(data, f.name)
-                
-                mock_print.assert_called_once()
-                
-            # Verify file content is empty
-            saved_content = Path(f.name).read_text()
-            assert saved_content == ""
+        saver.save_to_file(data, str(file_path))
             
-        Path(f.name).unlink()  # cleanup
-        
-    def test_save_to_file_yaml_invalid_yaml_string(self):
+        assert len(printed) == 1
+            
+        # Verify file content is empty
+        assert file_path.read_bytes() == b""
+
+    def test_save_to_file_yaml_invalid_yaml_string(self, tmp_path, saver, printed):
         """Test save_to_file for invalid YAML string as plain text."""
         data = "not: valid: yaml: string: with: too: many: colons:"
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            saver = DataSaver()
+        file_path = tmp_path / "data.yaml"
             
-            with patch.object(saver.console, 'print') as mock_print:
-                saver.save_to_file(data, f.name)
-                
-                # Should have two calls: warning and success
-                assert mock_print.call_count == 2
-                warning_call = mock_print.call_args_list[0][0][0]
-                success_call = mock_print.call_args_list[1][0][0]
-                assert "Warning: String is not valid data format" in warning_call
-                assert "Data saved to" in success_call
-                
-            # Verify file content is the original string
-            saved_content = Path(f.name).read_text()
-            assert saved_content == data
+        saver.save_to_file(data, str(file_path))
             
-        Path(f.name).unlink()  # cleanup
-        
-    def test_save_to_file_yaml_error(self):
+        # Should have two calls: warning and success
+        assert len(printed) == 2
+        warning_call = printed[0]
+        success_call = printed[1]
+        assert "Warning: String is not valid data format" in warning_call
+        assert "Data saved to" in success_call
+            
+        # Verify file content is the original string
+        assert file_path.read_bytes() == data.encode()
+
+    def test_save_to_file_yaml_error(self, saver, monkeypatch, printed):
         """Test YAML save error handling."""
         data = {"test": "value"}
         
-        saver = DataSaver()
+        monkeypatch.setattr(Path, 'write_text', _raising(IOError("Disk full")))
+        saver.save_to_file(data, '/invalid/path/file.yaml')
         
-        with patch('pathlib.Path.write_text', side_effect=IOError("Disk full")):
-            with patch.object(saver.console, 'print') as mock_print:
-                saver.save_to_file(data, '/invalid/path/file.yaml')
-                
-                mock_print.assert_called_once()
-                call_args = mock_print.call_args[0][0]
-                assert "Error saving file:" in call_args
-                assert "Disk full" in call_args
-                
-    def test_save_text_to_file(self):
+        assert len(printed) == 1
+        call_args = printed[0]
+        assert "Error saving file:" in call_args
+        assert "Disk full" in call_args
+        
+    def test_save_text_to_file(self, tmp_path, saver, printed):
         """Test save_to_file for text to file."""
         data = "This is a test text content\nwith multiple lines."
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            saver = DataSaver()
+        file_path = tmp_path / "data.txt"
             
-            with patch.object(saver.console, 'print') as mock_print:
-                saver.save_text_to_file(data, f.name)
-                
-                mock_print.assert_called_once()
-                call_args = mock_print.call_args[0][0]
-                assert "Text data saved to" in call_args
-                
-            # Verify file content
-            saved_content = Path(f.name).read_text()
-            assert saved_content == data
+        saver.save_text_to_file(data, str(file_path))
             
-        Path(f.name).unlink()  # cleanup
-        
-    def test_save_text_to_file_error(self):
+        assert len(printed) == 1
+        call_args = printed[0]
+        assert "Text data saved to" in call_args
+            
+        # Verify file content
+        assert file_path.read_bytes() == data.encode()
+
+    def test_save_text_to_file_error(self, saver, monkeypatch, printed):
         """Test text save error handling."""
         data = "test content"
         
-        saver = DataSaver()
+        monkeypatch.setattr(Path, 'write_text', _raising(OSError("No space left")))
+        saver.save_text_to_file(data, '/invalid/path/file.txt')
         
-        with patch('pathlib.Path.write_text', side_effect=OSError("No space left")):
-            with patch.object(saver.console, 'print') as mock_print:
-                saver.save_text_to_file(data, '/invalid/path/file.txt')
-                
-                mock_print.assert_called_once()
-                call_args = mock_print.call_args[0][0]
-                assert "Error saving text file:" in call_args
-                assert "No space left" in call_args
-                
-    def test_save_json_extension(self):
-        """Test save method with JSON extension."""
-        data = {"test": "value"}
+        assert len(printed) == 1
+        call_args = printed[0]
+        assert "Error saving text file:" in call_args
+        assert "No space left" in call_args
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            saver = DataSaver()
-            
-            with patch.object(saver, 'save_to_file') as mock_save_json:
-                saver.save(data, f.name)
-                mock_save_json.assert_called_once_with(data, f.name)
-                
-        Path(f.name).unlink()  # cleanup
-        
-    def test_save_yaml_extension(self):
-        """Test save method with YAML extension."""
+    @pytest.mark.parametrize("suffix", [".json", ".yaml", ".yml"])
+    def test_save_data_extension(self, tmp_path, saver, suffix):
+        """Test save method with JSON and YAML extensions."""
         data = {"test": "value"}
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            saver = DataSaver()
+        file_path = tmp_path / f"data{suffix}"
             
-            with patch.object(saver, 'save_to_file') as mock_save_yaml:
-                saver.save(data, f.name)
-                mock_save_yaml.assert_called_once_with(data, f.name)
-                
-        Path(f.name).unlink()  # cleanup
-        
-    def test_save_yml_extension(self):
-        """Test save method with YML extension."""
-        data = {"test": "value"}
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            saver = DataSaver()
-            
-            with patch.object(saver, 'save_to_file') as mock_save_yaml:
-                saver.save(data, f.name)
-                mock_save_yaml.assert_called_once_with(data, f.name)
-                
-        Path(f.name).unlink()  # cleanup
-        
-    def test_save_dict_no_extension(self):
+        with patch.object(saver, 'save_to_file') as mock_save:
+            saver.save(data, str(file_path))
+            mock_save.assert_called_once_with(data, str(file_path))
+
+    def test_save_dict_no_extension(self, tmp_path, saver):
         """Test save method with dict data and no extension (defaults to JSON)."""
         data = {"test": "value"}
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            saver = DataSaver()
+        file_path = tmp_path / "data"
             
-            with patch.object(saver, 'save_to_file') as mock_save_json:
-                saver.save(data, f.name)
-                mock_save_json.assert_called_once_with(data, f.name)
-                
-        Path(f.name).unlink()  # cleanup
-        
-    def test_save_list_no_extension(self):
+        with patch.object(saver, 'save_to_file') as mock_save_json:
+            saver.save(data, str(file_path))
+            mock_save_json.assert_called_once_with(data, str(file_path))
+
+    def test_save_list_no_extension(self, tmp_path, saver):
         """Test save method with list data and no extension (defaults to JSON)."""
         data = [1, 2, 3]
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            saver = DataSaver()
+        file_path = tmp_path / "data"
             
-            with patch.object(saver, 'save_to_file') as mock_save_json:
-                saver.save(data, f.name)
-                mock_save_json.assert_called_once_with(data, f.name)
-                
-        Path(f.name).unlink()  # cleanup
-        
-    def test_save_string_no_extension(self):
+        with patch.object(saver, 'save_to_file') as mock_save_json:
+            saver.save(data, str(file_path))
+            mock_save_json.assert_called_once_with(data, str(file_path))
+
+    def test_save_string_no_extension(self, tmp_path, saver):
         """Test save method with string data and no extension."""
         data = "test string content"
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            saver = DataSaver()
+        file_path = tmp_path / "data"
             
-            with patch.object(saver, 'save_text_to_file') as mock_save_text:
-                saver.save(data, f.name)
-                mock_save_text.assert_called_once_with(data, f.name)
-                
-        Path(f.name).unlink()  # cleanup
-        
-    def test_save_unknown_type(self):
+        with patch.object(saver, 'save_text_to_file') as mock_save_text:
+            saver.save(data, str(file_path))
+            mock_save_text.assert_called_once_with(data, str(file_path))
+
+    def test_save_unknown_type(self, tmp_path, saver, printed):
         """Test save method with unknown data type."""
         data = 12345  # integer
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            saver = DataSaver()
-            
-            with patch.object(saver.console, 'print') as mock_print:
-                with patch.object(saver, 'save_text_to_file') as mock_save_text:
-                    saver.save(data, f.name)
-                    
-                    # Should print warning about unknown type
-                    mock_print.assert_called_once()
-                    call_args = mock_print.call_args[0][0]
-                    assert "Unknown data type" in call_args
-                    
-                    # Should save as string
-                    mock_save_text.assert_called_once_with("12345", f.name)
+        file_path = tmp_path / "data"
+            
+        with patch.object(saver, 'save_text_to_file') as mock_save_text:
+            saver.save(data, str(file_path))
                 
-        Path(f.name).unlink()  # cleanup
+            # Should print warning about unknown type
+            assert len(printed) == 1
+            call_args = printed[0]
+            assert "Unknown data type" in call_args
+                
+            # Should save as string
+            mock_save_text.assert_called_once_with("12345", str(file_path))
 
 
 class TestIntegration:
     """Integration tests for DataLoader and DataSaver."""
     
-    def test_round_trip_json(self):
-        """Test loading and saving JSON data maintains integrity."""
-        original_data = {
-            "name": "test",
-            "items": [1, 2, 3],
-            "config": {"debug": True, "timeout": 30},
-            "unicode": "тест"
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            # Save data
-            saver = DataSaver()
-            with patch.object(saver.console, 'print'):
-                saver.save_to_file(original_data, f.name)
-            
-            # Load data back
-            loader = DataLoader()
-            loaded_data = loader.load_from_file(f.name)
-            
-            assert loaded_data == original_data
-            
-        Path(f.name).unlink()  # cleanup
-        
-    def test_round_trip_yaml(self):
-        """Test loading and saving YAML data maintains integrity."""
-        original_data = {
-            "name": "test",
-            "items": [1, 2, 3],
-            "config": {"debug": True, "timeout": 30},
-            "unicode": "тест"
-        }
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            # Save data
-            saver = DataSaver()
-            with patch.object(saver.console, 'print'):
-                saver.save_to_file(original_data, f.name)
-            
-            # Load data back
-            loader = DataLoader()
-            loaded_data = loader.load_from_file(f.name)
-            
-            assert loaded_data == original_data
-            
-        Path(f.name).unlink()  # cleanup
-        
-    def test_cross_format_compatibility(self):
-        """Test that data saved as YAML can be loaded and saved as JSON."""
-        original_data = {"name": "test", "value": 123}
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as yaml_file:
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as json_file:
-                # Save as YAML
-                saver = DataSaver()
-                with patch.object(saver.console, 'print'):
-                    saver.save_to_file(original_data, yaml_file.name)
-                
-                # Load from YAML
-                loader = DataLoader()
-                loaded_data = loader.load_from_file(yaml_file.name)
-                
-                # Save as JSON
-                with patch.object(saver.console, 'print'):
-                    saver.save_to_file(loaded_data, json_file.name)
-                
-                # Load from JSON and verify
-                final_data = loader.load_from_file(json_file.name)
-                assert final_data == original_data
-                
-        Path(yaml_file.name).unlink()  # cleanup
-        Path(json_file.name).unlink()  # cleanup
-
-    def test_save_to_file_json_extension(self):
-        """Test save_to_file with .json extension."""
-        data = {"key": "value", "numbers": [1, 2, 3]}
-        saver = DataSaver()
+    @pytest.mark.parametrize("suffix", [".json", ".yaml"], ids=["json", "yaml"])
+    def test_round_trip(self, tmp_path, loader, saver, suffix):
+        """Test loading and saving JSON and YAML data maintains integrity."""
+        file_path = tmp_path / f"data{suffix}"
+        # Save data
+        saver.save_to_file(ROUND_TRIP_DATA, str(file_path))
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as f:
-            with patch.object(saver.console, 'print'):
-                saver.save_to_file(data, f.name)
+        # Load data back
+        loaded_data = loader.load_from_file(str(file_path))
             
-            # Read and verify JSON content
-            with open(f.name, 'r') as rf:
-                content = rf.read()
-                loaded_data = json.loads(content)
-                assert loaded_data == data
-                
-        Path(f.name).unlink()  # cleanup
+        assert loaded_data == ROUND_TRIP_DATA
 
-    def test_save_to_file_yaml_extension(self):
-        """Test save_to_file with .yaml extension."""
-        data = {"key": "value", "numbers": [1, 2, 3]}
-        saver = DataSaver()
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
-            with patch.object(saver.console, 'print'):
-                saver.save_to_file(data, f.name)
+    def test_cross_format_compatibility(self, tmp_path, loader, saver):
+        """Test that data saved as YAML can be loaded and saved as JSON."""
+        yaml_path = tmp_path / "data.yaml"
+        json_path = tmp_path / "data.json"
+        # Save as YAML
+        saver.save_to_file(CROSS_FORMAT_DATA, str(yaml_path))
             
-            # Read and verify YAML content
-            with open(f.name, 'r') as rf:
-                content = rf.read()
-                loaded_data = yaml.safe_load(content)
-                assert loaded_data == data
+        # Load from YAML
+        loaded_data = loader.load_from_file(str(yaml_path))
                 
-        Path(f.name).unlink()  # cleanup
-
-    def test_save_to_file_yml_extension(self):
-        """Test save_to_file with .yml extension."""
-        data = {"key": "value", "numbers": [1, 2, 3]}
-        saver = DataSaver()
-        
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.yml', delete=False) as f:
-            with patch.object(saver.console, 'print'):
-                saver.save_to_file(data, f.name)
+        # Save as JSON
+        saver.save_to_file(loaded_data, str(json_path))
             
-            # Read and verify YAML content
-            with open(f.name, 'r') as rf:
-                content = rf.read()
-                loaded_data = yaml.safe_load(content)
-                assert loaded_data == data
-                
-        Path(f.name).unlink()  # cleanup
+        # Load from JSON and verify
+        final_data = loader.load_from_file(str(json_path))
+        assert final_data == CROSS_FORMAT_DATA
 
-    def test_save_to_file_unknown_extension_dict(self):
-        """Test save_to_file with unknown extension defaults to JSON for dict."""
+    @pytest.mark.parametrize("suffix,decode", [
+        (".json", json.loads),
+        (".yaml", partial(yaml.load, Loader=Loader)),
+        (".yml", partial(yaml.load, Loader=Loader)),
+        (".JSON", json.loads),
+        (".YAML", partial(yaml.load, Loader=Loader)),
+        (".YML", partial(yaml.load, Loader=Loader)),
+        (".backup.json", json.loads),
+        (".old.yaml", partial(yaml.load, Loader=Loader)),
+    ], ids=["json", "yaml", "yml", "json_upper", "yaml_upper", "yml_upper", "json_multi_dot", "yaml_multi_dot"])
+    def test_save_to_file_extension(self, tmp_path, saver, suffix, decode):
+        """Test save_to_file formats data according to the .json, .yaml and .yml extensions."""
         data = {"key": "value", "numbers": [1, 2, 3]}
-        saver = DataSaver()
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            with patch.object(saver.console, 'print'):
-                saver.save_to_file(data, f.name)
-            
-            # Should default to JSON for dict/list data
-            with open(f.name, 'r') as rf:
-                content = rf.read()
-                loaded_data = json.loads(content)
-                assert loaded_data == data
-                
-        Path(f.name).unlink()  # cleanup
+        file_path = tmp_path / f"data{suffix}"
+        saver.save_to_file(data, str(file_path))
+        
+        # Read and verify the decoded content
+        loaded_data = decode(file_path.read_bytes())
+        assert loaded_data == data
+
+    @pytest.mark.parametrize("data", [
+        {"key": "value", "numbers": [1, 2, 3]},
+        [{"key": "value"}, {"numbers": [1, 2, 3]}],
+    ], ids=["dict", "list"])
+    def test_save_to_file_unknown_extension_data(self, tmp_path, saver, data):
+        """Test save_to_file with unknown extension defaults to JSON for dict and list."""
+        file_path = tmp_path / "data.txt"
+        saver.save_to_file(data, str(file_path))
+        
+        # Should default to JSON for dict/list data
+        loaded_data = json.loads(file_path.read_bytes())
+        assert loaded_data == data
 
-    def test_save_to_file_unknown_extension_string(self):
+    def test_save_to_file_unknown_extension_string(self, tmp_path, saver):
         """Test save_to_file with unknown extension saves string as-is."""
         data = "This is a plain text string"
-        saver = DataSaver()
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.txt', delete=False) as f:
-            with patch.object(saver.console, 'print'):
-                saver.save_to_file(data, f.name)
-            
-            # Should save string as-is
-            with open(f.name, 'r') as rf:
-                content = rf.read()
-                assert content == data
-                
-        Path(f.name).unlink()  # cleanup
+        file_path = tmp_path / "data.txt"
+        saver.save_to_file(data, str(file_path))
+        
+        # Should save string as-is
+        assert file_path.read_bytes() == data.encode()
 
 
 if __name__ == "__main__":
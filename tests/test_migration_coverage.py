@@ -7,134 +7,137 @@
 import pytest
 import yaml
 import json
-from pathlib import Path
-import sys
-import tempfile
-from unittest.mock import patch, mock_open
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
+from promabbix.core.fs_utils import Dumper
 from promabbix.core.migration import (
     detect_config_format, migrate_legacy_service
 )
 
+# Input configurations, serialized to UTF-8 once at import and shared by the tests
+UNIFIED_CONFIG = {
+    "groups": [
+        {
+            "name": "recording_rules",
+            "rules": [{"record": "test", "expr": "1"}]
+        }
+    ],
+    "zabbix": {
+        "template": "test_template"
+    }
+}
+ALERTS_DATA = {
+    "groups": [
+        {
+            "name": "service_alerts",
+            "rules": [
+                {
+                    "alert": "test_alert",
+                    "expr": "metric > 1",
+                    "annotations": {
+                        "summary": "Test alert"
+                    }
+                }
+            ]
+        }
+    ]
+}
+ZABBIX_VARS = {
+    "zabbix": {
+        "template": "test_template",
+        "name": "Test Template Name"
+    }
+}
+
+UNIFIED_YAML = yaml.dump(UNIFIED_CONFIG, Dumper=Dumper, encoding='utf-8')
+UNIFIED_JSON = json.dumps(UNIFIED_CONFIG).encode()
+MISSING_GROUPS_YAML = yaml.dump({"zabbix": UNIFIED_CONFIG["zabbix"]}, Dumper=Dumper, encoding='utf-8')
+MISSING_ZABBIX_YAML = yaml.dump({"groups": UNIFIED_CONFIG["groups"]}, Dumper=Dumper, encoding='utf-8')
+ALERTS_YAML = yaml.dump(ALERTS_DATA, Dumper=Dumper, encoding='utf-8')
+ZABBIX_VARS_YAML = yaml.dump(ZABBIX_VARS, Dumper=Dumper, encoding='utf-8')
+LEGACY_ALERTS_STUB = b"groups: []"
+LEGACY_ZABBIX_STUB = b"zabbix:\n  template: test"
+
+
+def _materialize(root, files):
+    """Write files, a mapping of file name to content bytes, into root."""
+    for name, content in files.items():
+        (root / name).write_bytes(content)
+
 
 class TestDetectConfigFormat:
     """Test format detection functionality."""
 
-    def test_detect_config_format_unified_file_yaml(self, temp_directory):
+    def test_detect_config_format_unified_file_yaml(self, tmp_path):
         """Test detecting unified format from YAML file."""
-        unified_file = temp_directory / "unified.yaml"
-        unified_config = {
-            "groups": [
-                {
-                    "name": "recording_rules",
-                    "rules": [{"record": "test", "expr": "1"}]
-                }
-            ],
-            "zabbix": {
-                "template": "test_template"
-            }
-        }
-        unified_file.write_text(yaml.dump(unified_config))
+        unified_file = tmp_path / "unified.yaml"
+        unified_file.write_bytes(UNIFIED_YAML)
         
         result = detect_config_format(str(unified_file))
         assert result == "unified"
 
-    def test_detect_config_format_unified_file_json(self, temp_directory):
+    def test_detect_config_format_unified_file_json(self, tmp_path):
         """Test detecting unified format from JSON file."""
-        unified_file = temp_directory / "unified.json"
-        unified_config = {
-            "groups": [
-                {
-                    "name": "recording_rules",
-                    "rules": [{"record": "test", "expr": "1"}]
-                }
-            ],
-            "zabbix": {
-                "template": "test_template"
-            }
-        }
-        unified_file.write_text(json.dumps(unified_config))
+        unified_file = tmp_path / "unified.json"
+        unified_file.write_bytes(UNIFIED_JSON)
         
         result = detect_config_format(str(unified_file))
         assert result == "unified"
 
-    def test_detect_config_format_invalid_unified_file_missing_groups(self, temp_directory):
+    def test_detect_config_format_invalid_unified_file_missing_groups(self, tmp_path):
         """Test detecting invalid unified file missing groups."""
-        invalid_file = temp_directory / "invalid.yaml"
-        invalid_config = {
-            "zabbix": {
-                "template": "test_template"
-            }
-            # Missing groups section
-        }
-        invalid_file.write_text(yaml.dump(invalid_config))
+        invalid_file = tmp_path / "invalid.yaml"
+        invalid_file.write_bytes(MISSING_GROUPS_YAML)
         
-        with pytest.raises(ValueError) as excinfo:
+        with pytest.raises(ValueError, match="doesn't match unified format"):
             detect_config_format(str(invalid_file))
-        assert "doesn't match unified format" in str(excinfo.value)
 
-    def test_detect_config_format_invalid_unified_file_missing_zabbix(self, temp_directory):
+    def test_detect_config_format_invalid_unified_file_missing_zabbix(self, tmp_path):
         """Test detecting invalid unified file missing zabbix."""
-        invalid_file = temp_directory / "invalid.yaml"
-        invalid_config = {
-            "groups": [
-                {
-                    "name": "recording_rules",
-                    "rules": [{"record": "test", "expr": "1"}]
-                }
-            ]
-            # Missing zabbix section
-        }
-        invalid_file.write_text(yaml.dump(invalid_config))
+        invalid_file = tmp_path / "invalid.yaml"
+        invalid_file.write_bytes(MISSING_ZABBIX_YAML)
         
-        with pytest.raises(ValueError) as excinfo:
+        with pytest.raises(ValueError, match="doesn't match unified format"):
             detect_config_format(str(invalid_file))
-        assert "doesn't match unified format" in str(excinfo.value)
 
-    def test_detect_config_format_invalid_yaml_file(self, temp_directory):
+    def test_detect_config_format_invalid_yaml_file(self, tmp_path):
         """Test detecting format with invalid YAML content."""
-        invalid_file = temp_directory / "invalid.yaml"
-        invalid_file.write_text("invalid: yaml: content: [missing closing bracket")
+        invalid_file = tmp_path / "invalid.yaml"
+        invalid_file.write_bytes(b"invalid: yaml: content: [missing closing bracket")
         
-        with pytest.raises(ValueError) as excinfo:
+        with pytest.raises(ValueError, match="Could not parse"):
             detect_config_format(str(invalid_file))
-        assert "Could not parse" in str(excinfo.value)
 
-    def test_detect_config_format_legacy_directory_valid(self, temp_directory):
+    def test_detect_config_format_legacy_directory_valid(self, tmp_path):
         """Test detecting legacy three-file format in directory."""
         # Create legacy structure
-        (temp_directory / "service_alerts.yaml").write_text("groups: []")
-        (temp_directory / "zabbix_vars.yaml").write_text("zabbix:\n  template: test")
+        _materialize(tmp_path, {
+            "service_alerts.yaml": LEGACY_ALERTS_STUB,
+            "zabbix_vars.yaml": LEGACY_ZABBIX_STUB,
+        })
         
-        result = detect_config_format(str(temp_directory))
+        result = detect_config_format(str(tmp_path))
         assert result == "legacy_three_file"
 
-    def test_detect_config_format_legacy_directory_missing_zabbix_vars(self, temp_directory):
+    def test_detect_config_format_legacy_directory_missing_zabbix_vars(self, tmp_path):
         """Test detecting legacy directory missing zabbix_vars.yaml."""
         # Create only alerts file
-        (temp_directory / "service_alerts.yaml").write_text("groups: []")
+        (tmp_path / "service_alerts.yaml").write_bytes(LEGACY_ALERTS_STUB)
         
-        with pytest.raises(ValueError) as excinfo:
-            detect_config_format(str(temp_directory))
-        assert "doesn't match legacy three-file format" in str(excinfo.value)
+        with pytest.raises(ValueError, match="doesn't match legacy three-file format"):
+            detect_config_format(str(tmp_path))
 
-    def test_detect_config_format_legacy_directory_missing_alerts(self, temp_directory):
+    def test_detect_config_format_legacy_directory_missing_alerts(self, tmp_path):
         """Test detecting legacy directory missing alert files."""
         # Create only zabbix_vars file
-        (temp_directory / "zabbix_vars.yaml").write_text("zabbix:\n  template: test")
+        (tmp_path / "zabbix_vars.yaml").write_bytes(LEGACY_ZABBIX_STUB)
         
-        with pytest.raises(ValueError) as excinfo:
-            detect_config_format(str(temp_directory))
-        assert "doesn't match legacy three-file format" in str(excinfo.value)
+        with pytest.raises(ValueError, match="doesn't match legacy three-file format"):
+            detect_config_format(str(tmp_path))
 
     def test_detect_config_format_non_existent_path(self):
         """Test detecting format with non-existent path."""
-        with pytest.raises(ValueError) as excinfo:
+        with pytest.raises(ValueError, match="is neither a file nor a directory"):
             detect_config_format("/non/existent/path")
-        assert "is neither a file nor a directory" in str(excinfo.value)
 
 
 
@@ -142,52 +145,22 @@ class TestDetectConfigFormat:
 class TestMigrateLegacyService:
     """Test complete legacy service migration."""
 
-    def test_migrate_legacy_service_basic_structure(self, temp_directory):
+    def test_migrate_legacy_service_basic_structure(self, tmp_path):
         """Test migrating basic legacy service structure."""
         # Create legacy files
-        alerts_file = temp_directory / "service_alerts.yaml"
-        alerts_data = {
-            "groups": [
-                {
-                    "name": "service_alerts",
-                    "rules": [
-                        {
-                            "alert": "test_alert",
-                            "expr": "metric > 1",
-                            "annotations": {
-                                "summary": "Test alert"
-                            }
-                        }
-                    ]
-                }
-            ]
-        }
-        alerts_file.write_text(yaml.dump(alerts_data))
-        
-        zabbix_vars_file = temp_directory / "zabbix_vars.yaml"
-        zabbix_vars_wrapper = {
-            "zabbix": {
-                "template": "test_template",
-                "name": "Test Template Name"
-            }
-        }
-        zabbix_vars_file.write_text(yaml.dump(zabbix_vars_wrapper))
+        _materialize(tmp_path, {
+            "service_alerts.yaml": ALERTS_YAML,
+            "zabbix_vars.yaml": ZABBIX_VARS_YAML,
+        })
         
-        result = migrate_legacy_service(str(temp_directory))
+        result = migrate_legacy_service(str(tmp_path))
         
         assert "groups" in result
         assert "zabbix" in result
         assert result["zabbix"]["template"] == "test_template"
 
-    def test_migrate_legacy_service_with_error_conditions(self, temp_directory):
+    def test_migrate_legacy_service_with_error_conditions(self):
         """Test migrating with various error conditions."""
         # Test with non-existent directory
         with pytest.raises(ValueError):
             migrate_legacy_service("/non/existent/path")
-
-
-@pytest.fixture
-def temp_directory():
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
\ No newline at end of file
@@ -8,17 +8,8 @@
 Unit tests for refactored PromabbixApp (now just a CLI wrapper) and GenerateTemplateCommand.
 """
 
-import pytest
-import tempfile
-import json
-import sys
-import os
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
 from promabbix.core.fs_utils import DataLoader, DataSaver
 from promabbix.core.validation import ConfigValidator
 from promabbix.cli.generate_template import GenerateTemplateCommand
@@ -51,7 +42,7 @@ class TestGenerateTemplateCommandCore:
         assert command.saver is mock_saver
         assert command.validator is mock_validator
 
-    def test_load_configuration_from_file(self, temp_directory):
+    def test_load_configuration_from_file(self, tmp_path):
         """Test load_configuration method with file input."""
         mock_loader = MagicMock(spec=DataLoader)
         test_data = {"test": "data"}
@@ -59,7 +50,7 @@ class TestGenerateTemplateCommandCore:
         
         command = GenerateTemplateCommand(loader=mock_loader)
         
-        config_file = temp_directory / "config.yaml"
+        config_file = tmp_path / "config.yaml"
         config_file.write_text("test: data")
         
         result = command.load_configuration(str(config_file))
@@ -90,12 +81,12 @@ class TestGenerateTemplateCommandCore:
         
         mock_validator.validate_config.assert_called_once_with(test_config)
 
-    def test_save_template_to_file(self, temp_directory):
+    def test_save_template_to_file(self, tmp_path):
         """Test save_template method with file output."""
         mock_saver = MagicMock(spec=DataSaver)
         command = GenerateTemplateCommand(saver=mock_saver)
         
-        output_file = temp_directory / "output.json"
+        output_file = tmp_path / "output.json"
         template_data = '{"template": "data"}'
         
         command.save_template(template_data, str(output_file))
@@ -117,7 +108,7 @@ class TestGenerateTemplateCommandCore:
 class TestGenerateTemplateCommandExecution:
     """Test GenerateTemplateCommand execute method and workflow."""
     
-    def test_execute_validate_only_success(self, temp_directory):
+    def test_execute_validate_only_success(self, tmp_path):
         """Test execute method in validate-only mode with successful validation."""
         mock_loader = MagicMock(spec=DataLoader)
         mock_validator = MagicMock(spec=ConfigValidator)
@@ -127,7 +118,7 @@ class TestGenerateTemplateCommandExecution:
         
         command = GenerateTemplateCommand(loader=mock_loader, validator=mock_validator)
         
-        config_file = temp_directory / "config.yaml"
+        config_file = tmp_path / "config.yaml"
         config_file.write_text("test config")
         
         with patch.object(command, 'print_validation_success') as mock_print:
@@ -143,7 +134,7 @@ class TestGenerateTemplateCommandExecution:
         mock_validator.validate_config.assert_called_once_with(test_config)
         mock_print.assert_called_once()
 
-    def test_execute_full_workflow_success(self, temp_directory):
+    def test_execute_full_workflow_success(self, tmp_path):
         """Test execute method full workflow (validation + template generation)."""
         mock_loader = MagicMock(spec=DataLoader)
         mock_validator = MagicMock(spec=ConfigValidator)
@@ -160,9 +151,9 @@ class TestGenerateTemplateCommandExecution:
             saver=mock_saver
         )
         
-        config_file = temp_directory / "config.yaml"
+        config_file = tmp_path / "config.yaml"
         config_file.write_text("groups: []\nzabbix:\n  template: test")  # Create the file so it exists
-        output_file = temp_directory / "output.json"
+        output_file = tmp_path / "output.json"
         
         with patch.object(command, 'generate_template_content', return_value=template_content):
             result = command.execute(
@@ -177,7 +168,7 @@ class TestGenerateTemplateCommandExecution:
         mock_validator.validate_config.assert_called_once_with(test_config)
         mock_saver.save_to_file.assert_called_once_with(template_content, str(output_file))
 
-    def test_execute_validation_error(self, temp_directory):
+    def test_execute_validation_error(self, tmp_path):
         """Test execute method handles validation errors correctly."""
         from promabbix.core.validation import ValidationError
         
@@ -190,7 +181,7 @@ class TestGenerateTemplateCommandExecution:
         
         command = GenerateTemplateCommand(loader=mock_loader, validator=mock_validator)
         
-        config_file = temp_directory / "config.yaml"
+        config_file = tmp_path / "config.yaml"
         config_file.write_text("invalid: config")  # Create the file so it exists
         
         with patch.object(command, 'print_validation_error') as mock_print:
@@ -205,14 +196,14 @@ class TestGenerateTemplateCommandExecution:
         assert result == 1
         mock_print.assert_called_once()
 
-    def test_execute_general_exception(self, temp_directory):
+    def test_execute_general_exception(self, tmp_path):
         """Test execute method handles general exceptions correctly."""
         mock_loader = MagicMock(spec=DataLoader)
         mock_loader.load_from_file.side_effect = Exception("File error")
         
         command = GenerateTemplateCommand(loader=mock_loader)
         
-        config_file = temp_directory / "config.yaml"
+        config_file = tmp_path / "config.yaml"
         
         result = command.execute(
             config_file=str(config_file),
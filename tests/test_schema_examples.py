@@ -5,13 +5,8 @@
 #
 
 import pytest
-import json
 import yaml
 from pathlib import Path
-import sys
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 
 class TestSchemaValidationExamples:
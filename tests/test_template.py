@@ -9,15 +9,8 @@ import tempfile
 import json
 import os
 import uuid
-import hashlib
-import time
 from pathlib import Path
-from unittest.mock import patch, MagicMock, mock_open
-from datetime import datetime
-
-# Add src to path for imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+from unittest.mock import patch
 
 from promabbix.core.template import (
     date_time, to_uuid4, get_jinja2_globals, Render
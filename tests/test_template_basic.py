@@ -9,19 +9,9 @@ Basic tests for template module that don't require external dependencies.
 """
 
 import pytest
-import tempfile
-import json
-import os
 import uuid
 import hashlib
-import time
-from pathlib import Path
 from unittest.mock import patch, MagicMock
-from datetime import datetime
-
-# Add src to path for imports
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from promabbix.core.template import date_time, to_uuid4
 
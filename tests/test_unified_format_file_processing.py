@@ -7,21 +7,13 @@
 import pytest
 import yaml
 import json
-from pathlib import Path
-import sys
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from promabbix.core.fs_utils import DataLoader
-from promabbix.cli.generate_template import GenerateTemplateCommand
 
 
 class TestUnifiedFormatFileProcessing:
     """Test processing of unified format files end-to-end."""
 
     @pytest.fixture
-    def sample_unified_file(self, temp_directory):
+    def sample_unified_file(self, tmp_path):
         """Create a sample unified alert config file."""
         config = {
             "groups": [
@@ -184,12 +176,12 @@ return JSON.stringify(result);"""
             }
         }
         
-        config_file = temp_directory / "redis-config.yaml"
+        config_file = tmp_path / "redis-config.yaml"
         config_file.write_text(yaml.dump(config, default_flow_style=False, sort_keys=False))
         return config_file
 
     @pytest.fixture  
-    def sample_second_unified_file(self, temp_directory):
+    def sample_second_unified_file(self, tmp_path):
         """Create a sample unified alert config file."""
         config = {
             "groups": [
@@ -284,12 +276,12 @@ return JSON.stringify(result);"""
             }
         }
         
-        config_file = temp_directory / "data-export-config.yaml"
+        config_file = tmp_path / "data-export-config.yaml"
         config_file.write_text(yaml.dump(config, default_flow_style=False, sort_keys=False))
         return config_file
 
     @pytest.fixture
-    def malformed_unified_file(self, temp_directory):
+    def malformed_unified_file(self, tmp_path):
         """Create a malformed unified config file for testing error handling."""
         malformed_config = {
             "groups": [
@@ -343,13 +335,12 @@ return JSON.stringify(result);"""
             # Missing prometheus section (optional but referenced in examples)
         }
         
-        config_file = temp_directory / "malformed-config.yaml"
+        config_file = tmp_path / "malformed-config.yaml"
         config_file.write_text(yaml.dump(malformed_config, default_flow_style=False))
         return config_file
 
-    def test_load_unified_file(self, sample_unified_file):
+    def test_load_unified_file(self, sample_unified_file, loader):
         """Test loading unified config file."""
-        loader = DataLoader()
         config = loader.load_from_file(str(sample_unified_file))
         
         assert "groups" in config
@@ -364,9 +355,8 @@ return JSON.stringify(result);"""
         assert config["groups"][1]["name"] == "alerting_rules"
         assert config["zabbix"]["template"] == "service_redis"
 
-    def test_load_second_unified_file(self, sample_second_unified_file):
+    def test_load_second_unified_file(self, sample_second_unified_file, loader):
         """Test loading unified config file."""
-        loader = DataLoader()
         config = loader.load_from_file(str(sample_second_unified_file))
         
         assert "groups" in config
@@ -378,11 +368,10 @@ return JSON.stringify(result);"""
         assert len(config["groups"][1]["rules"]) == 2
         assert "data_export_queue_depth" in [rule["alert"] for rule in config["groups"][1]["rules"]]
 
-    def test_promabbix_app_with_unified_file_validation_only(self, sample_unified_file):
+    def test_promabbix_app_with_unified_file_validation_only(self, sample_unified_file, generate_command):
         """Test GenerateTemplateCommand with validation-only mode on unified file."""
-        command = GenerateTemplateCommand()
         # Test validation-only mode
-        result = command.execute(
+        result = generate_command.execute(
             config_file=str(sample_unified_file),
             output="/tmp/output.json",
             templates=None,
@@ -391,27 +380,21 @@ return JSON.stringify(result);"""
         )
         assert result == 0  # Should validate successfully
 
-    def test_promabbix_app_with_unified_file_template_generation(self, sample_unified_file, temp_directory):
+    def test_promabbix_app_with_unified_file_template_generation(self, sample_unified_file, tmp_path, stub_render, generate_command):
         """Test GenerateTemplateCommand generating templates from unified file."""
-        from unittest.mock import patch
+        output_file = tmp_path / "output.json"
         
-        command = GenerateTemplateCommand()
-        output_file = temp_directory / "output.json"
-        
-        # Mock template rendering to avoid needing actual template files
-        with patch('promabbix.core.template.Render.render_file', return_value='{"mock": "template"}'):
-            result = command.execute(
-                config_file=str(sample_unified_file),
-                output=str(output_file),
-                templates=None,
-                template_name="prometheus_alert_rules_to_zbx_template.j2",
-                validate_only=False
-            )
-            assert result == 0  # Should generate template successfully
+        result = generate_command.execute(
+            config_file=str(sample_unified_file),
+            output=str(output_file),
+            templates=None,
+            template_name="prometheus_alert_rules_to_zbx_template.j2",
+            validate_only=False
+        )
+        assert result == 0  # Should generate template successfully
 
-    def test_malformed_unified_file_validation_errors(self, malformed_unified_file):
+    def test_malformed_unified_file_validation_errors(self, malformed_unified_file, loader):
         """Test validation errors with malformed unified config file."""
-        loader = DataLoader()
         config = loader.load_from_file(str(malformed_unified_file))
         
         # Should provide detailed validation errors
@@ -420,7 +403,7 @@ return JSON.stringify(result);"""
         with pytest.raises(ValidationError):
             validator.validate_config(config)
 
-    def test_stdin_unified_format_processing(self, sample_unified_file):
+    def test_stdin_unified_format_processing(self, sample_unified_file, loader):
         """Test processing unified format from STDIN."""
         from unittest.mock import patch
         
@@ -430,30 +413,24 @@ return JSON.stringify(result);"""
         
         # Mock stdin with the YAML content
         with patch('sys.stdin.read', return_value=yaml_content):
-            loader = DataLoader()
             config = loader.load_from_stdin()
             
             assert "groups" in config
             assert "zabbix" in config
             assert config["zabbix"]["template"] == "service_redis"
 
-    def test_stdout_template_generation(self, sample_unified_file):
+    def test_stdout_template_generation(self, sample_unified_file, stub_render, generate_command):
         """Test generating Zabbix template to STDOUT from unified file."""
-        from unittest.mock import patch
-        
-        command = GenerateTemplateCommand()
-        # Mock template rendering to avoid needing actual template files
-        with patch('promabbix.core.template.Render.render_file', return_value='{"mock": "template"}'):
-            result = command.execute(
-                config_file=str(sample_unified_file),
-                output="-",
-                templates=None,
-                template_name="prometheus_alert_rules_to_zbx_template.j2",
-                validate_only=False
-            )
-            assert result == 0  # Should output template to stdout
+        result = generate_command.execute(
+            config_file=str(sample_unified_file),
+            output="-",
+            templates=None,
+            template_name="prometheus_alert_rules_to_zbx_template.j2",
+            validate_only=False
+        )
+        assert result == 0  # Should output template to stdout
 
-    def test_file_format_detection_yaml_vs_json(self, temp_directory):
+    def test_file_format_detection_yaml_vs_json(self, tmp_path, loader):
         """Test that DataLoader can handle both YAML and JSON unified formats."""
         config_dict = {
             "groups": [
@@ -466,22 +443,20 @@ return JSON.stringify(result);"""
         }
         
         # Test YAML format
-        yaml_file = temp_directory / "config.yaml"
+        yaml_file = tmp_path / "config.yaml"
         yaml_file.write_text(yaml.dump(config_dict))
         
         # Test JSON format  
-        json_file = temp_directory / "config.json"
+        json_file = tmp_path / "config.json"
         json_file.write_text(json.dumps(config_dict, indent=2))
         
-        loader = DataLoader()
-        
         yaml_config = loader.load_from_file(str(yaml_file))
         json_config = loader.load_from_file(str(json_file))
         
         assert yaml_config == json_config
         assert yaml_config["zabbix"]["template"] == "test_template"
 
-    def test_large_unified_config_performance(self, temp_directory):
+    def test_large_unified_config_performance(self, tmp_path, loader):
         """Test processing performance with large unified configuration."""
         # Generate a large config with many alerts
         large_config = {
@@ -535,11 +510,10 @@ return JSON.stringify(result);"""
             }
         }
         
-        large_file = temp_directory / "large-config.yaml"
+        large_file = tmp_path / "large-config.yaml"
         large_file.write_text(yaml.dump(large_config, default_flow_style=False))
         
         # Test loading performance
-        loader = DataLoader()
         config = loader.load_from_file(str(large_file))
         
         assert len(config["groups"][0]["rules"]) == 100
@@ -556,7 +530,7 @@ class TestBackwardsCompatibility:
     """Test backwards compatibility with existing three-file format."""
 
     @pytest.fixture
-    def sample_unified_file(self, temp_directory):
+    def sample_unified_file(self, tmp_path):
         """Create a sample unified config file for testing."""
         import yaml
         config = {
@@ -589,14 +563,14 @@ class TestBackwardsCompatibility:
             }
         }
         
-        config_file = temp_directory / "unified-config.yaml"
+        config_file = tmp_path / "unified-config.yaml"
         config_file.write_text(yaml.dump(config, default_flow_style=False))
         return config_file
 
     @pytest.fixture
-    def legacy_three_file_structure(self, temp_directory):
+    def legacy_three_file_structure(self, tmp_path):
         """Create legacy three-file structure for compatibility testing."""
-        service_dir = temp_directory / "service" / "test-service"
+        service_dir = tmp_path / "service" / "test-service"
         service_dir.mkdir(parents=True)
         
         # alerts.yaml
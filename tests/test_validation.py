@@ -6,12 +6,6 @@
 
 import pytest
 import json
-import yaml
-from pathlib import Path
-import sys
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from promabbix.core.validation import ConfigValidator, ValidationError
 
@@ -26,9 +20,9 @@ class TestConfigValidator:
         assert validator.schema is not None
         assert isinstance(validator.schema, dict)
 
-    def test_validator_with_custom_schema(self, temp_directory):
+    def test_validator_with_custom_schema(self, tmp_path):
         """Test validator can be initialized with custom schema."""
-        schema_file = temp_directory / "test_schema.json"
+        schema_file = tmp_path / "test_schema.json"
         schema = {
             "type": "object",
             "properties": {
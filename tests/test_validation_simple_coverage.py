@@ -6,13 +6,6 @@
 
 import pytest
 import json
-import yaml
-from pathlib import Path
-import sys
-import tempfile
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
 
 from promabbix.core.validation import (
     ConfigValidator, ValidationError, 
@@ -23,18 +16,18 @@ from promabbix.core.validation import (
 class TestValidationErrorHandlingSimple:
     """Test simple error handling scenarios in validation."""
 
-    def test_schema_file_not_found_error(self, temp_directory):
+    def test_schema_file_not_found_error(self, tmp_path):
         """Test ValidationError raised when schema file doesn't exist."""
-        non_existent_schema = str(temp_directory / "non_existent_schema.yaml")
+        non_existent_schema = str(tmp_path / "non_existent_schema.yaml")
         
         with pytest.raises(ValidationError) as excinfo:
             ConfigValidator(schema_path=non_existent_schema)
         
         assert "Schema file not found" in str(excinfo.value)
 
-    def test_schema_file_invalid_yaml_error(self, temp_directory):
+    def test_schema_file_invalid_yaml_error(self, tmp_path):
         """Test ValidationError raised when schema file has invalid YAML."""
-        invalid_yaml_schema = temp_directory / "invalid_schema.yaml"
+        invalid_yaml_schema = tmp_path / "invalid_schema.yaml"
         invalid_yaml_schema.write_text("invalid: yaml: content: [missing closing bracket")
         
         with pytest.raises(ValidationError) as excinfo:
@@ -42,6 +35,24 @@ class TestValidationErrorHandlingSimple:
         
         assert "Invalid format in schema file" in str(excinfo.value)
 
+    def test_schema_file_invalid_definition_error(self, tmp_path):
+        """Test ValidationError raised when schema is not a valid JSON Schema."""
+        invalid_schema = tmp_path / "invalid_definition.json"
+        invalid_schema.write_text(json.dumps({"type": "not_a_real_type"}))
+
+        with pytest.raises(ValidationError) as excinfo:
+            ConfigValidator(schema_path=str(invalid_schema))
+
+        assert "Invalid schema definition" in str(excinfo.value)
+
+    def test_default_schema_compiled_once(self):
+        """Test validators using the built-in schema share one compiled validator."""
+        first = ConfigValidator()
+        second = ConfigValidator()
+
+        assert first.schema_validator is second.schema_validator
+        assert first.schema_path == ConfigValidator.default_schema_path()
+
     def test_multiple_validation_errors_simple(self):
         """Test that multiple validation errors are handled."""
         config_with_errors = {
@@ -58,6 +69,26 @@ class TestValidationErrorHandlingSimple:
         with pytest.raises(ValidationError):
             validator.validate_config(config_with_errors)
 
+    def test_missing_required_field_suggestion(self):
+        """Test missing required field errors suggest adding the field."""
+        config = {"groups": [{"name": "recording_rules", "rules": [{"expr": "1"}]}], "zabbix": {}}
+
+        validator = ConfigValidator()
+        with pytest.raises(ValidationError) as excinfo:
+            validator.validate_config(config)
+
+        assert excinfo.value.suggestions == ["Add the missing required field"]
+
+    def test_invalid_enum_value_suggestion(self):
+        """Test invalid enum value errors suggest using an allowed value."""
+        config = {"groups": [{"name": "invalid_group_name", "rules": []}], "zabbix": {}}
+
+        validator = ConfigValidator()
+        with pytest.raises(ValidationError) as excinfo:
+            validator.validate_config(config)
+
+        assert excinfo.value.suggestions == ["Use one of the allowed enum values"]
+
 
 class TestConfigAnalyzerSimple:
     """Test ConfigAnalyzer utility methods."""
@@ -260,9 +291,102 @@ class TestCrossReferenceValidatorSimple:
         result = validator.should_validate_wiki_consistency(config)
         assert result is False
 
+    def test_should_validate_wiki_consistency_false_without_groups(self):
+        """Test should_validate_wiki_consistency when groups are missing."""
+        config = {
+            "wiki": {
+                "knowledgebase": {
+                    "alerts": {
+                        "alertings": {
+                            "test_alert": {"title": "Test Alert"}
+                        }
+                    }
+                }
+            }
+        }
+
+        validator = CrossReferenceValidator()
+        result = validator.should_validate_wiki_consistency(config)
+        assert result is False
+
+    def test_validate_alert_wiki_consistency_without_wiki(self):
+        """Test no errors are reported when wiki section is missing."""
+        config = {
+            "groups": [
+                {
+                    "name": "alerting_rules",
+                    "rules": [{"alert": "undocumented_alert", "expr": "metric > 1"}]
+                }
+            ]
+        }
+
+        validator = CrossReferenceValidator()
+        assert validator.validate_alert_wiki_consistency(config) == []
+
+    def test_validate_alert_wiki_consistency_empty_wiki(self):
+        """Test no errors are reported when wiki section is present but empty."""
+        config = {
+            "groups": [
+                {
+                    "name": "alerting_rules",
+                    "rules": [{"alert": "undocumented_alert", "expr": "metric > 1"}]
+                }
+            ],
+            "wiki": None
+        }
+
+        validator = CrossReferenceValidator()
+        assert validator.validate_alert_wiki_consistency(config) == []
+
+    def test_validate_alert_wiki_consistency_missing_docs(self):
+        """Test missing wiki documentation is reported for undocumented alerts."""
+        config = {
+            "groups": [
+                {
+                    "name": "alerting_rules",
+                    "rules": [
+                        {"alert": "documented_alert", "expr": "metric > 1"},
+                        {"alert": "undocumented_alert", "expr": "metric > 2"}
+                    ]
+                }
+            ],
+            "wiki": {
+                "knowledgebase": {
+                    "alerts": {
+                        "alertings": {
+                            "documented_alert": {"title": "Documented Alert"}
+                        }
+                    }
+                }
+            }
+        }
+
+        validator = CrossReferenceValidator()
+        errors = validator.validate_alert_wiki_consistency(config)
+        assert len(errors) == 1
+        assert errors[0].message == "Alerts missing wiki documentation: undocumented_alert"
+        assert errors[0].path == "wiki.knowledgebase.alerts.alertings"
+
+    def test_validate_alert_wiki_consistency_all_documented(self):
+        """Test no errors are reported when wiki documents every alert."""
+        config = {
+            "groups": [
+                {
+                    "name": "alerting_rules",
+                    "rules": [{"alert": "documented_alert", "expr": "metric > 1"}]
+                }
+            ],
+            "wiki": {
+                "knowledgebase": {
+                    "alerts": {
+                        "alertings": {
+                            "documented_alert": {"title": "Documented Alert"},
+                            "extra_alert": {"title": "Extra Alert"}
+                        }
+                    }
+                }
+            }
+        }
 
-@pytest.fixture
-def temp_directory():
-    """Create a temporary directory for test files."""
-    with tempfile.TemporaryDirectory() as tmpdir:
-        yield Path(tmpdir)
\ No newline at end of file
+        validator = CrossReferenceValidator()
+        assert validator.validate_alert_wiki_consistency(config) == []
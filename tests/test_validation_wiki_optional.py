@@ -4,14 +4,7 @@
 # Copyright 2025 Wrike Inc.
 #
 
-import pytest
-from pathlib import Path
-import sys
-
-# Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
-
-from promabbix.core.validation import ConfigValidator, ValidationError
+from promabbix.core.validation import ConfigValidator
 
 
 class TestWikiSectionOptional: